@@ -0,0 +1,103 @@
+"""Measure how long it takes to move from one question to the next.
+
+Runs the answers widget headless and times how long it takes, from a new
+question being set, for the widget to have settled down with the new
+answers on display. As in a quiz, each question is got ready before it's
+set.
+
+Run with:
+
+    python benchmarks/question_latency.py [questions]
+"""
+
+##############################################################################
+# Python imports.
+import sys
+from asyncio import run
+from statistics import median, quantiles
+from time import perf_counter
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from quizzical.app.widgets import Answers
+from quizzical.opentdb import Question
+
+
+##############################################################################
+class AnswersApp(App[None]):
+    """An application that just shows the answers to questions."""
+
+    def compose(self) -> ComposeResult:
+        yield Answers()
+
+
+##############################################################################
+def question(number: int) -> Question:
+    """Make a question to show.
+
+    Args:
+        number: The number of the question.
+
+    Returns:
+        The question; every third one is a true/false question.
+    """
+    if number % 3 == 2:
+        return Question(
+            "boolean", "easy", "Test", f"Question {number}?", "True", ["False"]
+        )
+    return Question(
+        "multiple",
+        "easy",
+        "Test",
+        f"Question {number}?",
+        f"Right {number}",
+        [f"Wrong {number}.{wrong}" for wrong in range(3)],
+    )
+
+
+##############################################################################
+async def measure(questions: int) -> list[float]:
+    """Measure the time taken to show each of a number of questions.
+
+    Args:
+        questions: The number of questions to show.
+
+    Returns:
+        The number of seconds each question took to show.
+    """
+    timings: list[float] = []
+    app = AnswersApp()
+    async with app.run_test(size=(80, 30)) as pilot:
+        answers = app.query_one(Answers)
+        await pilot.pause()
+        for number in range(questions):
+            # The quiz gets the next question ready while the feedback for
+            # the last answer is on screen, so do the same here.
+            upcoming = question(number)
+            answers.prepare(upcoming)
+            started = perf_counter()
+            answers.question = upcoming
+            await pilot.pause()
+            timings.append(perf_counter() - started)
+    return timings
+
+
+##############################################################################
+def main() -> None:
+    """Main entry point for the benchmark."""
+    questions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    timings = run(measure(questions))
+    print(f"Question to question latency over {questions} questions:")
+    print(f"  median: {median(timings) * 1000:6.2f}ms")
+    print(f"  p95:    {quantiles(timings, n=20)[-1] * 1000:6.2f}ms")
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### question_latency.py ends here
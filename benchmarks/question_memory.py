@@ -0,0 +1,106 @@
+"""Measure how much memory a large number of questions takes up.
+
+Builds questions the way the client does, from API-shaped data, and reports
+the bytes used per question, both before and after they've been decoded.
+Only what the questions hold on to is counted; the API data they were built
+from is thrown away, as it would be by the client.
+
+Run with:
+
+    python benchmarks/question_memory.py [count]
+"""
+
+##############################################################################
+# Python imports.
+import gc
+import sys
+import tracemalloc
+from base64 import b64encode
+from typing import Any
+from urllib.parse import quote
+
+##############################################################################
+# Local imports.
+from quizzical.opentdb import Question
+
+##############################################################################
+CATEGORIES = (
+    "General Knowledge",
+    "Entertainment: Books",
+    "Entertainment: Film",
+    "Science & Nature",
+    "Science: Computers",
+    "Geography",
+    "History",
+    "Animals",
+)
+"""Some category names to spread the questions over."""
+
+
+##############################################################################
+def api_data(count: int, encode: Any) -> list[dict[str, Any]]:
+    """Make some question data shaped like the API's.
+
+    Args:
+        count: The number of questions to make.
+        encode: The function to encode the text with.
+
+    Returns:
+        The question data.
+    """
+    return [
+        {
+            "type": encode("multiple"),
+            "difficulty": encode(("easy", "medium", "hard")[n % 3]),
+            "category": encode(CATEGORIES[n % len(CATEGORIES)]),
+            "question": encode(f"Which of these is the answer to question {n}?"),
+            "correct_answer": encode(f"The right answer {n}"),
+            "incorrect_answers": [encode(f"Wrong answer {n}.{m}") for m in range(3)],
+        }
+        for n in range(count)
+    ]
+
+
+##############################################################################
+def measure(count: int, encoding: Any, encode: Any) -> None:
+    """Measure the memory used by questions in a given encoding.
+
+    Args:
+        count: The number of questions to make.
+        encoding: The encoding to use.
+        encode: The function to encode the text with.
+    """
+    gc.collect()
+    tracemalloc.start()
+    questions = [
+        Question.from_api(question, encoding) for question in api_data(count, encode)
+    ]
+    gc.collect()
+    built, _ = tracemalloc.get_traced_memory()
+    for question in questions:
+        _ = question.category, question.question
+        _ = question.correct_answer, question.incorrect_answers
+    decoded, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{encoding:>8}: {built / count:7.1f} bytes/question encoded, "
+        f"{decoded / count:7.1f} bytes/question decoded "
+        f"({sys.getsizeof(questions[0])} bytes per instance)"
+    )
+
+
+##############################################################################
+def main() -> None:
+    """Main entry point for the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Memory used by {count:,} questions:")
+    measure(count, "html", str)
+    measure(count, "url3986", lambda text: quote(text, safe=""))
+    measure(count, "base64", lambda text: b64encode(text.encode()).decode())
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### question_memory.py ends here
@@ -0,0 +1,103 @@
+"""Measure how quickly the application starts up.
+
+Each run happens in a fresh Python process, so that nothing is already
+imported, and the application is run headless with its data kept in a
+throwaway directory. For each run this measures:
+
+- how long it takes to import the application;
+- how long until the main screen has first been painted;
+- which of the modules that shouldn't be needed at startup got imported.
+
+Run with:
+
+    python benchmarks/startup.py [runs]
+"""
+
+##############################################################################
+# Python imports.
+import json
+import os
+import subprocess
+import sys
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+##############################################################################
+DEFERRED = (
+    "quizzical.app.screens.confirm",
+    "quizzical.app.screens.quiz_maker",
+    "quizzical.app.screens.quiz_taker",
+    "quizzical.app.widgets.answer",
+    "quizzical.app.widgets.answers",
+    "textual_countdown",
+)
+"""Modules that shouldn't be imported until they're needed."""
+
+
+##############################################################################
+def once() -> None:
+    """Start the application once and report on how it went."""
+    from asyncio import run
+
+    started = perf_counter()
+    from quizzical.app import Quizzical
+
+    imported = perf_counter()
+
+    async def paint() -> float:
+        app = Quizzical()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            painted = perf_counter()
+            # Don't go on to make calls to the API.
+            for worker in app.workers:
+                worker.cancel()
+        return painted
+
+    painted = run(paint())
+    print(
+        json.dumps(
+            {
+                "import": imported - started,
+                "paint": painted - started,
+                "loaded": [module for module in DEFERRED if module in sys.modules],
+            }
+        )
+    )
+
+
+##############################################################################
+def main() -> None:
+    """Main entry point for the benchmark."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = []
+    with TemporaryDirectory() as data:
+        for _ in range(runs):
+            results.append(
+                json.loads(
+                    subprocess.run(
+                        [sys.executable, __file__, "--once"],
+                        env={**os.environ, "QUIZZICAL_DATA_DIR": data},
+                        capture_output=True,
+                        check=True,
+                        text=True,
+                    ).stdout.splitlines()[-1]
+                )
+            )
+    print(f"Startup over {runs} runs (median):")
+    print(f"  import:      {median(r['import'] for r in results) * 1000:7.1f}ms")
+    print(f"  first paint: {median(r['paint'] for r in results) * 1000:7.1f}ms")
+    if loaded := sorted({module for r in results for module in r["loaded"]}):
+        print(f"  imported too early: {', '.join(loaded)}")
+        sys.exit(1)
+
+
+##############################################################################
+if __name__ == "__main__":
+    if "--once" in sys.argv:
+        once()
+    else:
+        main()
+
+### startup.py ends here
@@ -1,14 +1,18 @@
 """The main entry point for the application."""
 
+##############################################################################
+# Python imports.
+import sys
+
 ##############################################################################
 # Local imports.
-from .app import Quizzical
+from .cli import main
 
 
 ##############################################################################
 def run() -> None:
     """Run the application."""
-    Quizzical().run()
+    sys.exit(main())
 
 
 ##############################################################################
@@ -1,8 +1,31 @@
 """Quizzical - a trivia quiz game for the terminal."""
 
+##############################################################################
+# Python imports.
+from typing import TYPE_CHECKING, Any
+
 ##############################################################################
 # Local imports.
-from .quizzical import Quizzical
+if TYPE_CHECKING:
+    from .quizzical import Quizzical
+
+
+##############################################################################
+def __getattr__(name: str) -> Any:
+    """Import the application on first use.
+
+    Args:
+        name: The name of the export.
+
+    Returns:
+        The export.
+    """
+    if name == "Quizzical":
+        from .quizzical import Quizzical
+
+        return Quizzical
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 ##############################################################################
 # Exports.
@@ -3,11 +3,30 @@
 ##############################################################################
 # Local imports.
 from .locations import data_dir
+from .pool_file import pool_file
+from .pool_warmer import warm_pool
 from .quiz_parameters import QuizParameters, QuizTimer
-from .quizzes_file import quizzes_file
+from .quizzes_file import load_quiz_batches, load_quizzes, quizzes_file, save_quizzes
+from .stats_file import dump_stats, stats_file
+from .token_file import token_file
+from .trivia_client import trivia_client
 
 ##############################################################################
 # Exports.
-__all__ = ["data_dir", "QuizParameters", "quizzes_file", "QuizTimer"]
+__all__ = [
+    "data_dir",
+    "dump_stats",
+    "load_quiz_batches",
+    "load_quizzes",
+    "pool_file",
+    "QuizParameters",
+    "quizzes_file",
+    "QuizTimer",
+    "save_quizzes",
+    "stats_file",
+    "token_file",
+    "trivia_client",
+    "warm_pool",
+]
 
 ### __init__.py ends here
@@ -2,6 +2,8 @@
 
 ##############################################################################
 # Python imports.
+from functools import cache
+from os import environ
 from pathlib import Path
 
 ##############################################################################
@@ -17,6 +19,7 @@ def _quizzical_dir(root: Path) -> Path:
 
 
 ##############################################################################
+@cache
 def data_dir() -> Path:
     """The path to the data directory for the application.
 
@@ -25,8 +28,15 @@ def data_dir() -> Path:
 
     Note:
         If the directory doesn't exist, it will be created as a side-effect
-        of calling this function.
+        of the first call to this function; the path is then remembered
+        for the rest of the run.
+
+        If `QUIZZICAL_DATA_DIR` is set in the environment, that directory
+        is used in place of the usual location.
     """
+    if override := environ.get("QUIZZICAL_DATA_DIR"):
+        (data := Path(override).expanduser()).mkdir(parents=True, exist_ok=True)
+        return data
     return _quizzical_dir(xdg_data_home())
 
 
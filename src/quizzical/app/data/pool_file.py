@@ -0,0 +1,18 @@
+"""Code relating to the file that holds the local question pool."""
+
+##############################################################################
+# Python imports.
+from pathlib import Path
+
+##############################################################################
+# Local imports.
+from .locations import data_dir
+
+
+##############################################################################
+def pool_file() -> Path:
+    """The path to the database that holds the local question pool."""
+    return data_dir() / "questions.db"
+
+
+### pool_file.py ends here
@@ -0,0 +1,127 @@
+"""Code for topping up the local question pool in the background."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from typing import TYPE_CHECKING, Callable, Iterable, TypeAlias
+
+##############################################################################
+# Local imports.
+from .quiz_parameters import QuizParameters
+
+if TYPE_CHECKING:
+    from ...opentdb import Difficulty, OpenTriviaDB, Type
+
+##############################################################################
+Kind: TypeAlias = "tuple[int | None, Difficulty | None, Type | None]"
+"""The category, difficulty and type that describe a kind of question."""
+
+
+##############################################################################
+def _covers(kind: Kind, other: Kind) -> bool:
+    """Does one kind of question take in every question of another kind?
+
+    Args:
+        kind: The kind that might take in the other.
+        other: The other kind.
+
+    Returns:
+        `True` if every question of the other kind is also of this kind.
+    """
+    return kind != other and all(
+        mine is None or mine == theirs for mine, theirs in zip(kind, other)
+    )
+
+
+##############################################################################
+def _wanted(quizzes: Iterable[QuizParameters]) -> dict[Kind, int]:
+    """Work out how many questions of each kind the quizzes want.
+
+    Args:
+        quizzes: The quizzes to work out the wants for.
+
+    Returns:
+        A mapping of kind of question to the number of questions wanted,
+        with the narrowest kinds first.
+
+    Note:
+        The pool's count for a kind of question includes the questions
+        kept for the narrower kinds it takes in; so the number wanted for
+        a kind includes the numbers wanted for those narrower kinds too.
+    """
+    wanted: dict[Kind, int] = {}
+    for quiz in quizzes:
+        kind = (quiz.category, quiz.difficulty, quiz.question_type)
+        wanted[kind] = max(wanted.get(kind, 0), quiz.number_of_questions)
+    return {
+        kind: amount
+        + sum(
+            narrower_amount
+            for narrower, narrower_amount in wanted.items()
+            if _covers(kind, narrower)
+        )
+        for kind, amount in sorted(wanted.items(), key=lambda want: want[0].count(None))
+    }
+
+
+##############################################################################
+async def _idle(client: OpenTriviaDB) -> None:
+    """Wait until the client has been left idle for a while.
+
+    Args:
+        client: The client to wait on.
+    """
+    from asyncio import sleep
+
+    while not client.rate_limiter.idle:
+        await sleep(client.rate_limiter.interval / 5)
+
+
+##############################################################################
+async def warm_pool(
+    client: OpenTriviaDB,
+    quizzes: Iterable[QuizParameters],
+    on_progress: Callable[[int, int], None] | None = None,
+    wait_for_idle: bool = True,
+) -> None:
+    """Top up the local question pool with questions the quizzes will want.
+
+    Args:
+        client: The API client to top up the pool with.
+        quizzes: The quizzes to top up the pool for.
+        on_progress: Optional callback that is told how many kinds of
+            question have been topped up, out of how many.
+        wait_for_idle: Should each call to the API wait until the client
+            has been left idle?
+
+    Note:
+        For each kind of question, enough questions to take the quiz that
+        wants the most of that kind once are kept in the pool, on top of
+        those kept for any narrower kinds of question it takes in.
+    """
+    from ...opentdb import NoResults
+
+    wanted = _wanted(quizzes)
+    for done, ((category, difficulty, of_type), amount) in enumerate(wanted.items()):
+        if on_progress is not None:
+            on_progress(done, len(wanted))
+        while (
+            shortfall := amount - await client.pooled(category, difficulty, of_type)
+        ) > 0:
+            if wait_for_idle:
+                await _idle(client)
+            try:
+                if not await client.prefetch(shortfall, category, difficulty, of_type):
+                    # The API had nothing new for us, so there's no sense in
+                    # going around again.
+                    break
+            except NoResults:
+                break
+    if on_progress is not None:
+        on_progress(len(wanted), len(wanted))
+
+
+### pool_warmer.py ends here
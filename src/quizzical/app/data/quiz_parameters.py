@@ -1,14 +1,19 @@
 """Provides code for working with quiz parameters."""
 
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
 from dataclasses import asdict, dataclass
 from enum import Enum
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 ##############################################################################
 # Local imports.
-from ...opentdb import Difficulty, Type
+if TYPE_CHECKING:
+    from ...opentdb import Difficulty, Type
 
 
 ##############################################################################
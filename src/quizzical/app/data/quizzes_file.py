@@ -2,11 +2,19 @@
 
 ##############################################################################
 # Python imports.
+from json import JSONDecodeError, JSONDecoder, dumps
+from os import fchmod, fsync, umask
 from pathlib import Path
+from re import Pattern
+from re import compile as compile_re
+from stat import S_IMODE
+from tempfile import NamedTemporaryFile
+from typing import Any, Final, Iterable, Iterator, TextIO
 
 ##############################################################################
 # Local imports.
 from .locations import data_dir
+from .quiz_parameters import QuizParameters
 
 
 ##############################################################################
@@ -15,4 +23,159 @@ def quizzes_file() -> Path:
     return data_dir() / "quizzes.json"
 
 
+##############################################################################
+_CHUNK_SIZE: Final[int] = 64 * 1024
+"""The number of characters to read from the quizzes file at a time."""
+
+##############################################################################
+_BETWEEN_ITEMS: Final[Pattern[str]] = compile_re(r"[\s,]*")
+"""Matches what can come between the items of a JSON array."""
+
+##############################################################################
+_AFTER_ITEM: Final[Pattern[str]] = compile_re(r"\s*[,\]]")
+"""Matches what has to follow an item of a JSON array for it to be complete."""
+
+
+##############################################################################
+def _json_array_items(source: TextIO) -> Iterator[Any]:
+    """Parse the items of a JSON array as they're read.
+
+    Args:
+        source: The source to read the JSON array from.
+
+    Yields:
+        Each item in the array, as soon as it has been read.
+
+    Raises:
+        JSONDecodeError: If the source isn't a JSON array.
+    """
+    decoder = JSONDecoder()
+    buffer = ""
+    while not (buffer := buffer.lstrip()) and (more := source.read(_CHUNK_SIZE)):
+        buffer += more
+    if not buffer.startswith("["):
+        raise JSONDecodeError("Expecting '['", buffer, 0)
+    position = 1
+    exhausted = False
+    while True:
+        if (between := _BETWEEN_ITEMS.match(buffer, position)) is not None:
+            position = between.end()
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except JSONDecodeError:
+            if exhausted:
+                raise
+            partial = True
+        else:
+            # Until what follows an item has been read, it might carry on
+            # in what's still to be read (a number could have more digits,
+            # or an exponent, still to come, for example).
+            partial = not exhausted and _AFTER_ITEM.match(buffer, end) is None
+        if partial:
+            # Most likely we've only got part of the next item so far; so
+            # read some more and try again.
+            buffer = buffer[position:] + (more := source.read(_CHUNK_SIZE))
+            position = 0
+            exhausted = not more
+            continue
+        yield item
+        position = end
+
+
+##############################################################################
+def load_quiz_batches(batch_size: int = 100) -> Iterator[list[QuizParameters]]:
+    """Load the saved quizzes a batch at a time.
+
+    Args:
+        batch_size: The number of quizzes in each batch.
+
+    Yields:
+        Batches of saved quizzes, as they're read from the quizzes file.
+
+    Raises:
+        FileNotFoundError: If no quizzes have been saved yet.
+    """
+    with quizzes_file().open(encoding="utf-8") as source:
+        batch: list[QuizParameters] = []
+        for quiz in _json_array_items(source):
+            batch.append(QuizParameters(**quiz))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+##############################################################################
+def load_quizzes() -> list[QuizParameters]:
+    """Load the saved quizzes.
+
+    Returns:
+        The saved quizzes.
+
+    Raises:
+        FileNotFoundError: If no quizzes have been saved yet.
+    """
+    return [quiz for batch in load_quiz_batches() for quiz in batch]
+
+
+##############################################################################
+def _mode_for(target: Path) -> int:
+    """Get the permissions a replacement for a file should have.
+
+    Args:
+        target: The file that is going to be replaced.
+
+    Returns:
+        The permissions of the file if it exists, otherwise the permissions
+        a newly-created file would normally be given.
+    """
+    try:
+        return S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        umask(current := umask(0))
+        return 0o666 & ~current
+
+
+##############################################################################
+def save_quizzes(quizzes: Iterable[QuizParameters]) -> None:
+    """Save the quizzes.
+
+    Args:
+        quizzes: The quizzes to save.
+
+    Note:
+        The quizzes are written to a temporary file that then replaces the
+        quizzes file, so a crash part way through saving can never leave a
+        half-written file behind. The temporary file is given the
+        permissions of the file it replaces, rather than the owner-only
+        permissions temporary files are created with.
+    """
+    target = quizzes_file()
+    with NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=target.parent,
+        prefix=f".{target.name}.",
+        delete=False,
+    ) as staging:
+        try:
+            staging.write(
+                dumps(
+                    [quiz.as_json for quiz in quizzes],
+                    indent=4,
+                    default=lambda x: x.value,
+                )
+            )
+            staging.flush()
+            fchmod(staging.fileno(), _mode_for(target))
+            fsync(staging.fileno())
+        except BaseException:
+            Path(staging.name).unlink()
+            raise
+    Path(staging.name).replace(target)
+
+
 ### quizzes_file.py ends here
@@ -0,0 +1,42 @@
+"""Code relating to the file that API statistics are dumped to."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from os import environ
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+##############################################################################
+# Local imports.
+from .locations import data_dir
+
+if TYPE_CHECKING:
+    from ...opentdb import OpenTriviaDB
+
+
+##############################################################################
+def stats_file() -> Path:
+    """The path to the file that API statistics are dumped to."""
+    return data_dir() / "api-stats.txt"
+
+
+##############################################################################
+def dump_stats(client: OpenTriviaDB) -> None:
+    """Dump the statistics for the calls a client made to the API.
+
+    Args:
+        client: The client to dump the statistics for.
+
+    Note:
+        The statistics are only dumped if the `QUIZZICAL_STATS` environment
+        variable is set.
+    """
+    if environ.get("QUIZZICAL_STATS"):
+        stats_file().write_text(client.stats().report, encoding="utf-8")
+
+
+### stats_file.py ends here
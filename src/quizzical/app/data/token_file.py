@@ -0,0 +1,18 @@
+"""Code relating to the file that holds the API session token."""
+
+##############################################################################
+# Python imports.
+from pathlib import Path
+
+##############################################################################
+# Local imports.
+from .locations import data_dir
+
+
+##############################################################################
+def token_file() -> Path:
+    """The path to the file that holds the API session token."""
+    return data_dir() / "session-token"
+
+
+### token_file.py ends here
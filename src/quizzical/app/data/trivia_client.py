@@ -0,0 +1,53 @@
+"""Code for making an Open Trivia DB client that uses the application's data."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Callable, Final
+
+##############################################################################
+# Local imports.
+from .locations import data_dir
+from .pool_file import pool_file
+from .token_file import token_file
+
+if TYPE_CHECKING:
+    from ...opentdb import OpenTriviaDB
+
+##############################################################################
+CACHE_TTL: Final[float] = 24 * 60 * 60
+"""The number of seconds that cached API responses stay fresh for."""
+
+
+##############################################################################
+def trivia_client(
+    on_wait: Callable[[float], None] | None = None, use_pool: bool = True
+) -> OpenTriviaDB:
+    """Make an Open Trivia DB client that keeps its data with the application's.
+
+    Args:
+        on_wait: Optional callback that is told how many seconds a call will
+            be held back to stay within the API's rate limit.
+        use_pool: Should the client serve from, and add to, the local
+            question pool?
+
+    Returns:
+        The client.
+    """
+    from ...opentdb import OpenTriviaDB, QuestionPool, ResponseCache
+
+    return OpenTriviaDB(
+        on_wait=on_wait,
+        token_file=token_file(),
+        pool=QuestionPool(pool_file()) if use_pool else None,
+        cache=ResponseCache(data_dir() / "cache", CACHE_TTL),
+        # HTTP/2 is an optional extra; use it if it's been installed.
+        http2=find_spec("h2") is not None,
+    )
+
+
+### trivia_client.py ends here
@@ -6,6 +6,7 @@ from textual.app import App
 
 ##############################################################################
 # Local imports.
+from .data import dump_stats, trivia_client
 from .screens import Main
 
 
@@ -15,9 +16,39 @@ class Quizzical(App[None]):
 
     ENABLE_COMMAND_PALETTE = False
 
+    def __init__(self) -> None:
+        """Initialise the application."""
+        super().__init__()
+        self._trivia = trivia_client(on_wait=self._rate_limit_wait)
+        """The Open Trivia DB client."""
+
+    def _rate_limit_wait(self, wait: float) -> None:
+        """Let the user know that a call to the backend is being held back.
+
+        Args:
+            wait: The number of seconds the call will be held back for.
+        """
+        if wait >= 1:
+            self.notify(
+                f"Waiting {wait:.0f} seconds to keep within the Open Trivia DB rate limit.",
+                title="Please wait",
+                timeout=wait,
+            )
+
     def on_mount(self) -> None:
         """Load up the main screen once the DOM is ready."""
-        self.push_screen(Main())
+        self.push_screen(Main(self._trivia))
+
+    async def on_unmount(self) -> None:
+        """Close down the API client as the application exits.
+
+        Note:
+            If the `QUIZZICAL_STATS` environment variable is set, the
+            statistics for the calls made to the API are dumped to a file in
+            the data directory.
+        """
+        await self._trivia.aclose()
+        dump_stats(self._trivia)
 
 
 ### quizzical.py ends here
@@ -1,21 +1,25 @@
 """The main screen of the application."""
 
+##############################################################################
+# Python imports.
+from asyncio import sleep
+from typing import Final
+
 ##############################################################################
 # Textual imports.
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Horizontal
+from textual.css.query import NoMatches
 from textual.screen import Screen
 from textual.widgets import Button, Label
 
 ##############################################################################
 # Local imports.
 from ... import __version__
-from ...opentdb import OpenTriviaDB
-from ..widgets import Logo, QuestionCounts, QuizList
-from .confirm import Confirm
-from .quiz_maker import QuizMaker
-from .quiz_taker import QuizTaker
+from ...opentdb import Category, OpenTriviaDB
+from ..data import warm_pool
+from ..widgets import Logo, PoolStatus, QuestionCounts, QuizList
 
 
 ##############################################################################
@@ -45,6 +49,9 @@ class Main(Screen[None]):
     }
     """
 
+    RECOVERY_INTERVAL: Final[float] = 10
+    """The minimum number of seconds between checks that the backend is back."""
+
     BINDINGS = [
         ("r", "run"),
         ("n", "new"),
@@ -53,9 +60,14 @@ class Main(Screen[None]):
         ("q", "quit"),
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, trivia: OpenTriviaDB) -> None:
+        """Initialise the main screen.
+
+        Args:
+            trivia: The Open Trivia DB client.
+        """
         super().__init__()
-        self._trivia = OpenTriviaDB()
+        self._trivia = trivia
         """The Open Trivia DB client."""
 
     def compose(self) -> ComposeResult:
@@ -63,6 +75,7 @@ class Main(Screen[None]):
         yield Logo()
         yield Label(f"v{__version__}", id="version")
         yield QuestionCounts("All Questions")
+        yield PoolStatus()
         yield QuizList()
         with Horizontal(id="buttons"):
             yield Button("Run [dim]\\[r][/]", id="run", disabled=True)
@@ -73,7 +86,13 @@ class Main(Screen[None]):
 
     def on_mount(self) -> None:
         """Load up the data for the main display."""
+        # Show whatever counts we have to hand right away; they'll be
+        # refreshed in the background if need be.
+        self.query_one(QuestionCounts).counts = self._trivia.cached_overall_counts()
         self._load_counts()
+        # The pool is only topped up once the quizzes are in, and there
+        # might not be any; so show what's in it from the start.
+        self._refresh_pool_status()
 
     def _connect_error(self) -> None:
         """Let the user know there was an error when connecting to the backend."""
@@ -83,15 +102,81 @@ class Main(Screen[None]):
             timeout=8,
         )
         self.query_one("#buttons").disabled = True
+        self._await_recovery()
+
+    @work(exclusive=True, group="recovery")
+    async def _await_recovery(self) -> None:
+        """Wait for the backend to be reachable again, then carry on as normal."""
+        while True:
+            await sleep(max(self._trivia.circuit.retry_in, self.RECOVERY_INTERVAL))
+            try:
+                await self._trivia.probe()
+            except self._trivia.RequestError:
+                continue
+            break
+        self.query_one("#buttons").disabled = False
+        self.notify("Connected to https://opentdb.com/ again.")
+        self._load_counts()
+        self._warm_pool()
 
     @work
     async def _load_counts(self) -> None:
-        """Load up the question counts."""
+        """Load up the question counts.
+
+        Note:
+            The categories are refreshed too, so that they're ready for
+            the quiz maker.
+        """
         try:
             self.query_one(QuestionCounts).counts = await self._trivia.overall_counts()
         except self._trivia.RequestError:
             self.query_one(QuestionCounts).counts = QuestionCounts.Unavailable()
             self._connect_error()
+            return
+        try:
+            await self._trivia.categories()
+        except self._trivia.RequestError:
+            # Not a problem for now; they'll be asked for again when the
+            # quiz maker is opened.
+            pass
+
+    @work(exclusive=True, group="pool-warmer")
+    async def _warm_pool(self) -> None:
+        """Top up the local question pool for the saved quizzes."""
+        try:
+            status = self.query_one(PoolStatus)
+        except NoMatches:
+            # The screen is being taken down; there's no sense in starting
+            # a top-up now.
+            return
+
+        def progress(topped_up: int, to_top_up: int) -> None:
+            status.progress(topped_up, to_top_up)
+            self._refresh_pool_status()
+
+        try:
+            await warm_pool(self._trivia, self.query_one(QuizList).quizzes, progress)
+        except self._trivia.RequestError:
+            status.progress(0, 0)
+
+    @work(exclusive=True, group="pool-status")
+    async def _refresh_pool_status(self) -> None:
+        """Refresh the count of questions ready to ask in the pool."""
+        ready = await self._trivia.pooled()
+        try:
+            self.query_one(PoolStatus).ready = ready
+        except NoMatches:
+            # The screen was taken down while the pool was being checked.
+            pass
+
+    @on(QuizList.Changed)
+    def _quizzes_changed(self) -> None:
+        """Top up the pool when the collection of quizzes changes."""
+        self._warm_pool()
+
+    def _quiz_taken(self, _: None) -> None:
+        """Top up the pool again once a quiz has been taken."""
+        self._warm_pool()
 
     @on(QuizList.Changed)
     def _update_buttons(self, event: QuizList.Changed) -> None:
@@ -107,19 +192,37 @@ class Main(Screen[None]):
     @on(Button.Pressed, "#run")
     def action_run(self) -> None:
         """Run the currently-hilighted quiz."""
+        from .quiz_taker import QuizTaker
+
         quizzes = self.query_one(QuizList)
         if quizzes.highlighted is not None:
             self.app.push_screen(
-                QuizTaker(self._trivia, quizzes.quizzes[quizzes.highlighted])
+                QuizTaker(self._trivia, quizzes.quizzes[quizzes.highlighted]),
+                self._quiz_taken,
             )
 
+    async def _categories(self) -> list[Category]:
+        """Get the categories to offer in the quiz maker.
+
+        Returns:
+            The categories.
+
+        Note:
+            Any list of categories to hand is used, no matter how old, so
+            that the quiz maker opens right away; the list is refreshed in
+            the background when the screen starts up.
+        """
+        return self._trivia.cached_categories() or await self._trivia.categories()
+
     @on(Button.Pressed, "#new")
     @work
     async def action_new(self) -> None:
         """Create a new quiz."""
+        from .quiz_maker import QuizMaker
+
         try:
             if quiz := await self.app.push_screen_wait(
-                QuizMaker(await self._trivia.categories())
+                QuizMaker(self._trivia, await self._categories())
             ):
                 self.query_one(QuizList).add_quiz(quiz)
         except self._trivia.RequestError:
@@ -129,11 +232,17 @@ class Main(Screen[None]):
     @work
     async def action_edit(self) -> None:
         """Edit the currently-highlighted quiz."""
+        from .quiz_maker import QuizMaker
+
         quizzes = self.query_one(QuizList)
         if (to_edit := quizzes.highlighted) is not None:
             try:
                 if quiz := await self.app.push_screen_wait(
-                    QuizMaker(await self._trivia.categories(), quizzes.quizzes[to_edit])
+                    QuizMaker(
+                        self._trivia,
+                        await self._categories(),
+                        quizzes.quizzes[to_edit],
+                    )
                 ):
                     quizzes.modify_quiz(to_edit, quiz)
             except self._trivia.RequestError:
@@ -143,6 +252,8 @@ class Main(Screen[None]):
     @work
     async def action_delete(self) -> None:
         """Delete the currently-highlighted quiz."""
+        from .confirm import Confirm
+
         if (to_delete := self.query_one(QuizList).highlighted) is not None:
             if await self.app.push_screen_wait(
                 Confirm("Delete Quiz", "Are you sure you want to delete that quiz?")
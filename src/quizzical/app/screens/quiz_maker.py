@@ -4,9 +4,13 @@
 # Python imports.
 from typing import cast, get_args
 
+##############################################################################
+# Humanize imports.
+from humanize import intcomma
+
 ##############################################################################
 # Textual imports.
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
@@ -15,7 +19,7 @@ from textual.widgets import Button, Input, Label, Select
 
 ##############################################################################
 # Local imports.
-from ...opentdb import Category, Difficulty, Type
+from ...opentdb import Category, Difficulty, OpenTriviaDB, Type
 from ..data import QuizParameters, QuizTimer
 
 
@@ -41,6 +45,11 @@ class QuizMaker(ModalScreen[QuizParameters | None]):
                 }
             }
 
+            #availability {
+                margin: 0 0 0 1;
+                color: $text-muted;
+            }
+
             &> Horizontal {
                 margin-top: 1;
                 height: auto;
@@ -56,19 +65,27 @@ class QuizMaker(ModalScreen[QuizParameters | None]):
     BINDINGS = [("escape", "cancel"), ("f2", "okay")]
 
     def __init__(
-        self, categories: list[Category], quiz: QuizParameters | None = None
+        self,
+        client: OpenTriviaDB,
+        categories: list[Category],
+        quiz: QuizParameters | None = None,
     ) -> None:
         """Initialise the quiz maker.
 
         Args:
+            client: The API client.
             categories: The list of categories that the user can select from.
             quiz: An optional existing quiz to populate the dialog with.
         """
         super().__init__()
+        self._client = client
+        """The trivia database client object."""
         self._categories = categories
         """The known categories for the questions."""
         self._quiz = quiz
         """Existing quiz parameters to populate the list with."""
+        self._available: int | None = None
+        """The number of questions available for the chosen options, if known."""
 
     def compose(self) -> ComposeResult:
         """Compose the content of the dialog."""
@@ -88,6 +105,7 @@ class QuizMaker(ModalScreen[QuizParameters | None]):
                 validators=Integer(minimum=1),
                 id="number",
             )
+            yield Label(id="availability")
             yield Label("Category:")
             yield Select[int](
                 ((category.name, category.id) for category in self._categories),
@@ -155,6 +173,48 @@ class QuizMaker(ModalScreen[QuizParameters | None]):
             self.query_one("#timer-type", Select).value = self._quiz.timer_type
             self.query_one("#timer-seconds", Input).value = str(self._quiz.timer_value)
             self._update_timer_fields()
+        self._check_availability()
+
+    @on(Select.Changed, "#category")
+    @on(Select.Changed, "#difficulty")
+    @on(Select.Changed, "#type")
+    @work(exclusive=True, group="availability")
+    async def _check_availability(self) -> None:
+        """Check how many questions are available for the chosen options."""
+        availability = self.query_one("#availability", Label)
+        availability.update("Checking how many questions are available...")
+        category = self.query_one("#category", Select).value
+        difficulty = self.query_one("#difficulty", Select).value
+        difficulty = (
+            cast(Difficulty, difficulty) if isinstance(difficulty, str) else None
+        )
+        try:
+            if isinstance(category, int):
+                self._available = (
+                    await self._client.difficulty_counts(category)
+                ).of_difficulty(difficulty)
+            else:
+                self._available = (await self._client.overall_counts()).verified
+        except self._client.RequestError:
+            self._available = None
+            availability.update("Unable to check how many questions are available.")
+        except self._client.UnknownCategory:
+            self._available = None
+            availability.update("That category can no longer be found.")
+        else:
+            # The counts are never broken down by question type, and aren't
+            # broken down by difficulty unless there's a category, so in
+            # those cases the best we can say is that there are up to so
+            # many questions.
+            approximate = not isinstance(category, int) and difficulty is not None
+            approximate |= isinstance(self.query_one("#type", Select).value, str)
+            availability.update(
+                f"{'Up to ' if approximate else ''}{intcomma(self._available)} "
+                f"question{'' if self._available == 1 else 's'} available."
+            )
+        number = self.query_one("#number", Input)
+        number.validators = [Integer(minimum=1, maximum=self._available)]
+        number.validate(number.value)
 
     @on(Select.Changed, "#timer-type")
     def _update_timer_fields(self) -> None:
@@ -176,10 +236,23 @@ class QuizMaker(ModalScreen[QuizParameters | None]):
         if not self.query_one("#title", Input).is_valid:
             self.notify("Please enter a title", title="Missing Title", severity="error")
             okay = False
-        if not self.query_one("#number", Input).is_valid:
-            self.notify(
-                "Please enter a valid number", title="Invalid Number", severity="error"
-            )
+        if not (number := self.query_one("#number", Input)).is_valid:
+            if (
+                self._available is not None
+                and number.value.isdigit()
+                and int(number.value) > self._available
+            ):
+                self.notify(
+                    f"Only {intcomma(self._available)} questions are available",
+                    title="Too Many Questions",
+                    severity="error",
+                )
+            else:
+                self.notify(
+                    "Please enter a valid number",
+                    title="Invalid Number",
+                    severity="error",
+                )
             okay = False
         timer_seconds = self.query_one("#timer-seconds", Input)
         if not timer_seconds.disabled:
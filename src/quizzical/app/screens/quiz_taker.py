@@ -1,19 +1,23 @@
 """Provides the screen used to take a quiz."""
 
+##############################################################################
+# Python imports.
+from typing import get_args
+
 ##############################################################################
 # Rich imports.
-from rich.console import Group
-from rich.table import Table
+from rich.text import Text
 
 ##############################################################################
 # Textual imports.
 from textual import on, work
 from textual.app import ComposeResult
-from textual.containers import Center, Grid, Vertical
+from textual.containers import Center, Grid, Vertical, VerticalScroll
 from textual.css.query import NoMatches
 from textual.reactive import var
 from textual.screen import ModalScreen
-from textual.widgets import Button, Digits, Label, LoadingIndicator, OptionList
+from textual.widget import Widget
+from textual.widgets import Button, Digits, Label, LoadingIndicator
 
 ##############################################################################
 # Textual countdown imports.
@@ -21,9 +25,9 @@ from textual_countdown import Countdown
 
 ##############################################################################
 # Local imports.
-from ...opentdb import OpenTriviaDB, Question
+from ...opentdb import Difficulty, NoResults, OpenTriviaDB, Question
 from ..data.quiz_parameters import QuizParameters, QuizTimer
-from ..widgets import Answers
+from ..widgets import Answers, QuizResults
 
 
 ##############################################################################
@@ -34,10 +38,6 @@ class QuizTaker(ModalScreen[None]):
     QuizTaker {
         align: center middle;
 
-        .hidden {
-            display: none;
-        }
-
         &> Vertical {
             background: $surface;
             border: panel $primary;
@@ -112,20 +112,21 @@ class QuizTaker(ModalScreen[None]):
         }
 
         #results {
-            width: auto;
-            max-width: 60%;
-            height: auto;
-            max-height: 80%;
+            width: 60%;
+            height: 80%;
             padding: 1 2 0 2;
             Label {
                 width: auto;
             }
-            #answers {
+            #summary {
+                height: auto;
+                max-height: 25%;
+                margin-top: 1;
+                color: $text-muted;
+            }
+            QuizResults {
                 height: 1fr;
                 margin: 1 0 1 0;
-                &> .option-list--option {
-                    padding: 0 5 1 0;
-                }
             }
             Center {
                 width: 100%;
@@ -161,51 +162,132 @@ class QuizTaker(ModalScreen[None]):
         """The parameters of the quiz we're going to take."""
         self._quiz: list[Question] = []
         """The questions being asked as part of the quiz."""
+        self._prepared: tuple[int, Text] | None = None
+        """The text of a question that has been got ready ahead of time."""
+        self._loading = True
+        """Are questions for the quiz still being loaded?"""
+        self._waiting = False
+        """Is the player waiting on more questions to be loaded?"""
+        self._panel: Widget | None = self._loader()
+        """The panel currently being shown, or `None` while switching panels."""
+
+    def _loader(self) -> Vertical:
+        """Build the panel that's shown while the quiz is loading.
+
+        Returns:
+            The panel.
+        """
+        loader = Vertical(
+            LoadingIndicator(), Center(Button("Cancel", id="cancel")), id="loader"
+        )
+        loader.border_title = f"Loading: {self._quiz_parameters.title}"
+        return loader
+
+    async def _confirmer(self) -> Vertical:
+        """Build the panel that asks if the player is ready to take the quiz.
+
+        Returns:
+            The panel.
+        """
+        confirmer = Vertical(
+            Label("The quiz is ready; are you all set to take it?"),
+            Center(Label(await self._quiz_summary(), id="details")),
+            Center(
+                Button("Let's go!", id="take", variant="success"),
+                Button("Cancel", id="cancel", variant="error"),
+            ),
+            id="confirmer",
+        )
+        confirmer.border_title = f"Ready to take '{self._quiz_parameters.title}'?"
+        return confirmer
+
+    def _taker(self) -> Vertical:
+        """Build the panel that the quiz is taken in.
+
+        Returns:
+            The panel.
+        """
+        taker = Vertical(
+            Grid(
+                Label("Question"),
+                Label("Out Of"),
+                Label("Correct"),
+                Label("Wrong"),
+                Digits("0", id="question"),
+                Digits(str(len(self._quiz)), id="out-of"),
+                Digits("0", id="correct"),
+                Digits("0", id="wrong"),
+            ),
+            *(
+                ()
+                if self._quiz_parameters.timer_type == QuizTimer.NONE
+                else (Countdown(),)
+            ),
+            Label(id="question-text"),
+            Answers(),
+            Center(Button("Retire", id="cancel")),
+            id="taker",
+        )
+        taker.border_title = self._quiz_parameters.title
+        return taker
+
+    def _results(self) -> Vertical:
+        """Build the panel that shows the results of the quiz.
+
+        Returns:
+            The panel.
+        """
+        results = Vertical(
+            Label(
+                f"Final score is {self._correct} out of {len(self._quiz)}.",
+                id="final-score",
+            ),
+            VerticalScroll(Label(self._summary()), id="summary", can_focus=False),
+            QuizResults(),
+            Center(Button("Close", id="cancel")),
+            id="results",
+        )
+        results.border_title = f"Results of '{self._quiz_parameters.title}'"
+        return results
 
     def compose(self) -> ComposeResult:
-        """Compose the quiz taking screen."""
+        """Compose the quiz taking screen.
 
-        with Vertical(id="loader") as quiz_loader:
-            quiz_loader.border_title = f"Loading: {self._quiz_parameters.title}"
-            yield LoadingIndicator()
-            with Center():
-                yield Button("Cancel", id="cancel")
+        Note:
+            Only the loading panel is composed to start with; each of the
+            other panels is built and mounted as the quiz gets to it.
+        """
+        if self._panel is not None:
+            yield self._panel
 
-        with Vertical(id="confirmer", classes="hidden") as quiz_confirmer:
-            quiz_confirmer.border_title = (
-                f"Ready to take '{self._quiz_parameters.title}'?"
-            )
-            yield Label("The quiz is now loaded and ready; are you all set to take it?")
-            with Center():
-                yield Label(id="details")
-            with Center():
-                yield Button("Let's go!", id="take", variant="success")
-                yield Button("Cancel", id="cancel", variant="error")
-
-        with Vertical(id="taker", classes="hidden") as quiz_taker:
-            quiz_taker.border_title = self._quiz_parameters.title
-            with Grid():
-                yield Label("Question")
-                yield Label("Out Of")
-                yield Label("Correct")
-                yield Label("Wrong")
-                yield Digits("0", id="question")
-                yield Digits("0", id="out-of")
-                yield Digits("0", id="correct")
-                yield Digits("0", id="wrong")
-            if self._quiz_parameters.timer_type != QuizTimer.NONE:
-                yield Countdown()
-            yield Label(id="question-text")
-            yield Answers()
-            with Center():
-                yield Button("Retire", id="cancel")
-
-        with Vertical(id="results", classes="hidden") as quiz_results:
-            quiz_results.border_title = f"Results of '{self._quiz_parameters.title}'"
-            yield Label(id="final-score")
-            yield OptionList(id="answers")
-            with Center():
-                yield Button("Close", id="cancel")
+    async def _switch_to(self, panel: Widget) -> None:
+        """Replace the panel being shown with another.
+
+        Args:
+            panel: The panel to show.
+
+        Note:
+            While the switch is under way there is no current panel; once
+            the new panel is mounted it's brought up to date with anything
+            that happened in the meantime.
+        """
+        showing, self._panel = self._panel, None
+        with self.app.batch_update():
+            if showing is not None:
+                await showing.remove()
+            await self.mount(panel)
+        self._panel = panel
+        await self._refresh_panel()
+
+    async def _refresh_panel(self) -> None:
+        """Bring the panel being shown up to date with the loaded questions."""
+        if self._panel is None:
+            # A switch is under way; the new panel is refreshed once it's in.
+            return
+        if self._panel.id == "confirmer":
+            self._panel.query_one("#details", Label).update(await self._quiz_summary())
+        elif self._panel.id == "taker":
+            self._panel.query_one("#out-of", Digits).update(str(len(self._quiz)))
 
     def on_mount(self) -> None:
         """Start the process of loading up the quiz once the DOM is ready."""
@@ -213,11 +295,24 @@ class QuizTaker(ModalScreen[None]):
 
     async def _quiz_summary(self) -> str:
         """A descriptive summary of the quiz."""
-        summary = f"{len(self._quiz)} question{'' if len(self._quiz) == 1 else 's'}\n"
+        if self._loading:
+            summary = (
+                f"{len(self._quiz)} of {self._quiz_parameters.number_of_questions}"
+                " questions loaded so far\n"
+            )
+        else:
+            summary = (
+                f"{len(self._quiz)} question{'' if len(self._quiz) == 1 else 's'}\n"
+            )
         if self._quiz_parameters.category is None:
             summary += "Any category\n"
         else:
-            summary += f"{(await self._client.category(self._quiz_parameters.category)).name}\n"
+            try:
+                category = await self._client.category(self._quiz_parameters.category)
+            except OpenTriviaDB.UnknownCategory:
+                summary += "Unknown category\n"
+            else:
+                summary += f"{category.name}\n"
         if self._quiz_parameters.difficulty is None:
             summary += "Any difficulty level\n"
         else:
@@ -239,30 +334,106 @@ class QuizTaker(ModalScreen[None]):
             )
         return summary
 
-    @work
+    @work(exclusive=True, group="quiz-loader")
     async def _load_quiz(self) -> None:
-        """Load the quiz from the backend."""
-        self._quiz = await self._client.questions(
-            amount=self._quiz_parameters.number_of_questions,
-            category=self._quiz_parameters.category,
-            difficulty=self._quiz_parameters.difficulty,
-            of_type=self._quiz_parameters.question_type,
-        )
-        with self.app.batch_update():
-            self.query_one("#loader").set_class(True, "hidden")
-            self.query_one("#confirmer").set_class(False, "hidden")
-            self.query_one("#confirmer #details", Label).update(
-                await self._quiz_summary()
-            )
+        """Load the quiz from the backend.
+
+        Note:
+            The questions are loaded a batch at a time; the quiz can be
+            started as soon as the first batch is in, with the rest being
+            added as they arrive.
+        """
+        try:
+            async for batch in self._client.question_batches(
+                amount=self._quiz_parameters.number_of_questions,
+                category=self._quiz_parameters.category,
+                difficulty=self._quiz_parameters.difficulty,
+                of_type=self._quiz_parameters.question_type,
+            ):
+                await self._add_questions(batch)
+        except NoResults:
+            pass
+        except self._client.RequestError as error:
+            if self._quiz:
+                self.notify(
+                    f"Only {len(self._quiz)} questions could be loaded.\n\n{error}",
+                    title="Problem Loading Questions",
+                    severity="warning",
+                )
+            else:
+                self.notify(str(error), title="Unable to Load Quiz", severity="error")
+        if not self._quiz:
+            self.notify("No questions could be found for this quiz.", severity="error")
+            self.dismiss()
+            return
+        await self._finish_loading()
+
+    async def _add_questions(self, questions: list[Question]) -> None:
+        """Add a batch of loaded questions to the quiz.
+
+        Args:
+            questions: The questions to add.
+        """
+        first_batch = not self._quiz
+        self._quiz.extend(questions)
+        if first_batch:
+            await self._switch_to(await self._confirmer())
             self.query_one("#take").focus()
+        else:
+            await self._refresh_panel()
+        if self._waiting:
+            self._waiting = False
+            self._question += 1
+
+    async def _finish_loading(self) -> None:
+        """Finish off loading the quiz."""
+        self._loading = False
+        await self._refresh_panel()
+        if self._waiting:
+            self._waiting = False
+            self.call_next(self._show_result)
+
+    def _wait_for_more(self) -> None:
+        """Hold the player while more questions are loaded."""
+        self._waiting = True
+        if self._quiz_parameters.timer_type == QuizTimer.PER_QUESTION:
+            # The clock for the next question starts when it's shown.
+            self.query_one(Countdown).cancel()
+        with self.app.batch_update():
+            self.query_one("#question-text", Label).update("Loading more questions...")
+            self.query_one(Answers).question = None
+
+    def _prepare(self, question: int) -> None:
+        """Get a question ready to show ahead of time.
+
+        Args:
+            question: The number of the question to get ready.
+        """
+        if question < len(self._quiz):
+            self._prepared = (question, Text(self._quiz[question].question))
+            self.query_one(Answers).prepare(self._quiz[question])
 
-    async def _watch__question(self) -> None:
+    def _answer_given(self, answer: Answers.Given | None) -> None:
+        """Get the next question ready while an answer is being shown.
+
+        Args:
+            answer: The answer that has been given.
+        """
+        if answer is not None:
+            self._prepare(self._question + 1)
+
+    def _watch__question(self) -> None:
         """React to the question number being bumped."""
-        self.query_one("#question", Digits).update(str(self._question + 1))
-        self.query_one("#question-text", Label).update(
-            self._quiz[self._question].question
-        )
-        self.query_one(Answers).question = self._quiz[self._question]
+        question = self._quiz[self._question]
+        if self._prepared is not None and self._prepared[0] == self._question:
+            text = self._prepared[1]
+        else:
+            text = Text(question.question)
+        self._prepared = None
+        with self.app.batch_update():
+            self.query_one("#question", Digits).update(str(self._question + 1))
+            self.query_one("#question-text", Label).update(text)
+            self.query_one(Answers).question = question
         if self._quiz_parameters.timer_type == QuizTimer.PER_QUESTION:
             self.query_one(Countdown).start(self._quiz_parameters.timer_value)
 
@@ -280,12 +451,11 @@ class QuizTaker(ModalScreen[None]):
         self.dismiss()
 
     @on(Button.Pressed, "#take")
-    def take_quiz(self) -> None:
+    async def take_quiz(self) -> None:
         """Start the process of taking the quiz."""
+        await self._switch_to(self._taker())
+        self.watch(self.query_one(Answers), "answer", self._answer_given, init=False)
         with self.app.batch_update():
-            self.query_one("#confirmer").set_class(True, "hidden")
-            self.query_one("#taker").set_class(False, "hidden")
-            self.query_one("#out-of", Digits).update(str(len(self._quiz)))
             self._question = 0
             self.query_one(Answers).focus()
             if self._quiz_parameters.timer_type == QuizTimer.WHOLE_QUIZ:
@@ -306,6 +476,8 @@ class QuizTaker(ModalScreen[None]):
         self._answers.append(event.answer)
         if self._question < (len(self._quiz) - 1):
             self._question += 1
+        elif self._loading:
+            self._wait_for_more()
         else:
             self.call_next(self._show_result)
 
@@ -314,43 +486,45 @@ class QuizTaker(ModalScreen[None]):
         """Process a timeout while answering a question."""
         if self._quiz_parameters.timer_type == QuizTimer.PER_QUESTION:
             self.query_one(Answers).skip_question()
+            self._prepare(self._question + 1)
         else:
             questions_left = len(self._quiz) - len(self._answers)
             self._answers.extend([None] * questions_left)
             self._wrong += questions_left
             self.call_next(self._show_result)
 
-    def _question_result(self, question: int) -> Group:
-        """Get the result display for a question.
-
-        Args:
-            question: The question to get the display for.
+    def _summary(self) -> Text:
+        """A summary of the results, by category and difficulty.
 
         Returns:
-            The display.
+            The summary.
         """
-        question_row = Table.grid()
-        question_row.add_column(width=5, justify="right")
-        question_row.add_column(width=1)
-        question_row.add_column(ratio=1)
-        question_row.add_row(f"{question + 1}. ", " ", self._quiz[question].question)
-        answer_row = Table.grid()
-        answer_row.add_column(width=6)
-        answer_row.add_column(ratio=1)
-        colour = (
-            "green"
-            if self._answers[question] == self._quiz[question].correct_answer
-            else "red"
-        )
-        answer_row.add_row(
-            "", f"[{colour}]{self._answers[question] or '(No answer given)'}[/]"
+        scores: dict[tuple[str, str], list[int]] = {}
+        for question, given in zip(self._quiz, self._answers):
+            score = scores.setdefault((question.category, question.difficulty), [0, 0])
+            score[0] += given == question.correct_answer
+            score[1] += 1
+        return Text(
+            "\n".join(
+                f"{category} ({difficulty}): {correct} out of {asked}"
+                for (category, difficulty), (correct, asked) in sorted(
+                    scores.items(),
+                    key=lambda score: (
+                        score[0][0],
+                        get_args(Difficulty).index(score[0][1]),
+                    ),
+                )
+            )
         )
-        return Group(question_row, answer_row)
 
     async def _show_result(self) -> None:
         """Show the result of the quiz."""
-        # Ensure that any running countdown is cancelled; we're all done
-        # here.
+        if self._panel is None or self._panel.id == "results":
+            # The results are already being shown, or are on their way.
+            return
+        # Ensure that any running countdown is cancelled, and that no more
+        # questions are loaded; we're all done here.
+        self.workers.cancel_group(self, "quiz-loader")
         try:
             self.query_one(Countdown).cancel()
         except NoMatches:
@@ -358,16 +532,9 @@ class QuizTaker(ModalScreen[None]):
             # countdown to begin with.
             pass
         # Having done that, show the results of the quiz.
-        with self.app.batch_update():
-            self.query_one("#taker").set_class(True, "hidden")
-            self.query_one("#results").set_class(False, "hidden")
-            self.query_one("#final-score", Label).update(
-                f"Final score is {self._correct} out of {len(self._quiz)}."
-            )
-            self.query_one("#answers", OptionList).add_options(
-                self._question_result(number) for number in range(len(self._answers))
-            )
-            self.query_one("#results #cancel").focus()
+        await self._switch_to(self._results())
+        self.query_one(QuizResults).show(list(zip(self._quiz, self._answers)))
+        self.query_one("#cancel").focus()
 
 
 ### quiz_taker.py ends here
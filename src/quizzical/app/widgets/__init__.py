@@ -1,14 +1,56 @@
 """Provides the application's custom widgets."""
 
+##############################################################################
+# Python imports.
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
 ##############################################################################
 # Local imports.
-from .answers import Answers
-from .logo import Logo
-from .question_counts import QuestionCounts
-from .quiz_list import QuizList
+if TYPE_CHECKING:
+    from .answers import Answers
+    from .logo import Logo
+    from .pool_status import PoolStatus
+    from .question_counts import QuestionCounts
+    from .quiz_list import QuizList
+    from .quiz_results import QuizResults
+
+##############################################################################
+_MODULES: Final[dict[str, str]] = {
+    "Answers": ".answers",
+    "Logo": ".logo",
+    "PoolStatus": ".pool_status",
+    "QuestionCounts": ".question_counts",
+    "QuizList": ".quiz_list",
+    "QuizResults": ".quiz_results",
+}
+"""The module that each widget lives in."""
+
+
+##############################################################################
+def __getattr__(name: str) -> Any:
+    """Import a widget on first use.
+
+    Args:
+        name: The name of the widget.
+
+    Returns:
+        The widget.
+    """
+    if name in _MODULES:
+        return getattr(import_module(_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 ##############################################################################
 # Exports.
-__all__ = ["Answers", "Logo", "QuestionCounts", "QuizList"]
+__all__ = [
+    "Answers",
+    "Logo",
+    "PoolStatus",
+    "QuestionCounts",
+    "QuizList",
+    "QuizResults",
+]
 
 ### __init__.py ends here
@@ -1,5 +1,9 @@
 """Provides a widget for displaying an answer."""
 
+##############################################################################
+# Rich imports.
+from rich.text import Text
+
 ##############################################################################
 # Textual imports.
 from textual.app import ComposeResult
@@ -33,7 +37,9 @@ class Answer(Horizontal):
     }
     """
 
-    def __init__(self, answer: str, number: int, classes: str | None = None) -> None:
+    def __init__(
+        self, answer: str | Text, number: int, classes: str | None = None
+    ) -> None:
         """Initialise the answer.
 
         Args:
@@ -52,5 +58,14 @@ class Answer(Horizontal):
         yield Digits(f"{self._number}:")
         yield Label(self._answer)
 
+    def show(self, answer: str | Text) -> None:
+        """Show a different answer.
+
+        Args:
+            answer: The answer text.
+        """
+        self._answer = answer
+        self.query_one(Label).update(answer)
+
 
 ### answer.py ends here
@@ -8,9 +8,15 @@ from __future__ import annotations
 # Python imports.
 from dataclasses import dataclass
 from functools import partial
+from typing import Final
+
+##############################################################################
+# Rich imports.
+from rich.text import Text
 
 ##############################################################################
 # Textual imports.
+from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.message import Message
 from textual.reactive import var
@@ -52,6 +58,9 @@ class Answers(Vertical, can_focus=True):
     }
     """
 
+    MAX_ANSWERS: Final[int] = 4
+    """The most answers a question can have."""
+
     BINDINGS = [((str(n), f"answer({n})")) for n in range(1, 5)]
 
     question: var[Question | None] = var(None, init=False)
@@ -73,15 +82,62 @@ class Answers(Vertical, can_focus=True):
     answer: var[Given | None] = var(None)
     """The answer being processed."""
 
-    async def _watch_question(self) -> None:
+    def __init__(self) -> None:
+        """Initialise the answers widget."""
+        super().__init__()
+        self._prepared: tuple[Question, tuple[Text, ...]] | None = None
+        """The answers to a question that have been got ready ahead of time."""
+
+    @staticmethod
+    def _content(question: Question) -> tuple[Text, ...]:
+        """Get the content to show for the answers to a question.
+
+        Args:
+            question: The question to get the answers for.
+
+        Returns:
+            The content for each of the answers.
+        """
+        return tuple(Text(answer) for answer in question.answers)
+
+    def prepare(self, question: Question) -> None:
+        """Get the answers to a question ready to show ahead of time.
+
+        Args:
+            question: The question that will be shown next.
+        """
+        self._prepared = (question, self._content(question))
+
+    def compose(self) -> ComposeResult:
+        """Compose the answers.
+
+        Note:
+            A fixed set of answer widgets is made up front; each question
+            reuses them rather than mounting new ones.
+        """
+        for number in range(self.MAX_ANSWERS):
+            answer = Answer("", number + 1, classes=("sep" if number else ""))
+            answer.display = False
+            yield answer
+
+    def _watch_question(self) -> None:
         """React to a new question being set."""
-        await self.query(Answer).remove()
-        if self.question is not None:
-            await self.mount_all(
-                Answer(question, number + 1, classes=("sep" if number else ""))
-                for number, question in enumerate(self.question.answers)
-            )
-            self.answer = None
+        if self.question is None:
+            answers: tuple[Text, ...] = ()
+        elif self._prepared is not None and self._prepared[0] is self.question:
+            answers = self._prepared[1]
+        else:
+            answers = self._content(self.question)
+        self._prepared = None
+        with self.app.batch_update():
+            for number, widget in enumerate(self.query(Answer)):
+                widget.remove_class("correct", "incorrect")
+                if number < len(answers):
+                    widget.show(answers[number])
+                    widget.display = True
+                else:
+                    widget.display = False
+        self.answer = None
 
     def action_answer(self, answer: int) -> None:
         """Process a player's answer.
@@ -89,12 +145,14 @@ class Answers(Vertical, can_focus=True):
         Args:
             answer: The answer given by the player.
         """
-        if self.question is None or self.answer is not None:
+        if (
+            self.question is None
+            or self.answer is not None
+            or answer > len(self.question.answers)
+        ):
             return
         self.answer = (
-            self.Correct
-            if self.question.correct_answer == self.question.answers[answer - 1]
-            else self.Incorrect
+            self.Correct if self.question.is_correct(answer - 1) else self.Incorrect
         )(self.question.answers[answer - 1])
         self.query_one(f"#answer-{answer}").set_class(
             True, "correct" if isinstance(self.answer, self.Correct) else "incorrect"
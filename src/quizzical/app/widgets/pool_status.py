@@ -0,0 +1,58 @@
+"""Provides a widget that shows the state of the local question pool."""
+
+##############################################################################
+# Humanize imports.
+from humanize import intcomma
+
+##############################################################################
+# Textual imports.
+from textual.app import RenderResult
+from textual.reactive import reactive
+from textual.widget import Widget
+
+
+##############################################################################
+class PoolStatus(Widget):
+    """Widget that shows the depth of the question pool and any top-up."""
+
+    DEFAULT_CSS = """
+    PoolStatus {
+        height: 1;
+        width: 1fr;
+        content-align: center middle;
+        color: $text-muted;
+    }
+    """
+
+    ready: reactive[int | None] = reactive(None)
+    """The number of questions in the pool that are ready to be asked."""
+
+    topped_up: reactive[int] = reactive(0)
+    """The number of kinds of question that have been topped up."""
+
+    to_top_up: reactive[int] = reactive(0)
+    """The number of kinds of question that are being topped up."""
+
+    def progress(self, topped_up: int, to_top_up: int) -> None:
+        """Update the progress of topping up the pool.
+
+        Args:
+            topped_up: The number of kinds of question topped up so far.
+            to_top_up: The number of kinds of question to top up.
+        """
+        self.topped_up = topped_up
+        self.to_top_up = to_top_up
+
+    def render(self) -> RenderResult:
+        """Render the content of the widget."""
+        status = (
+            "Question pool: checking..."
+            if self.ready is None
+            else f"Question pool: {intcomma(self.ready)} ready to ask"
+        )
+        if self.topped_up < self.to_top_up:
+            status += f" [dim](topping up {self.topped_up + 1} of {self.to_top_up})[/]"
+        return status
+
+
+### pool_status.py ends here
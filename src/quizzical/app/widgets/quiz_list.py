@@ -7,23 +7,21 @@ from __future__ import annotations
 ##############################################################################
 # Python imports.
 from dataclasses import dataclass
-from json import dumps, loads
+from threading import Lock
+from typing import Final
 
 ##############################################################################
 # Textual imports.
-from textual import on
-from textual.events import Mount
+from textual import on, work
+from textual.events import Mount, Unmount
 from textual.message import Message
 from textual.reactive import var
+from textual.timer import Timer
 from textual.widgets import OptionList
 
-##############################################################################
-# Backward-compatible typing.
-from typing_extensions import Self
-
 ##############################################################################
 # Local imports.
-from ..data import QuizParameters, quizzes_file
+from ..data import QuizParameters, load_quiz_batches, load_quizzes, save_quizzes
 
 
 ##############################################################################
@@ -47,9 +45,35 @@ class QuizList(OptionList):
         ("w, k, left", "cursor_up"),
     ]
 
-    quizzes: var[list[QuizParameters]] = var(list, always_update=True, init=False)
+    SAVE_DELAY: Final[float] = 0.5
+    """The number of seconds to wait for more changes before saving."""
+
+    LOAD_BATCH_SIZE: Final[int] = 100
+    """The number of quizzes to add to the list at a time while loading."""
+
+    quizzes: var[list[QuizParameters]] = var(list, init=False)
     """The list of all the quiz parameters."""
 
+    def __init__(self, id: str | None = None) -> None:  # pylint:disable=redefined-builtin
+        """Initialise the quiz list.
+
+        Args:
+            id: The ID of the quiz list in the DOM.
+        """
+        super().__init__(id=id)
+        self._save_timer: Timer | None = None
+        """The timer for the pending save, if there is one."""
+        self._generation = 0
+        """The generation of the latest snapshot of the quizzes to be saved."""
+        self._written = 0
+        """The generation of the last snapshot of the quizzes to be written."""
+        self._saving = Lock()
+        """Makes sure only one save happens at a time."""
+        self._loading = True
+        """Are the saved quizzes still being loaded?"""
+        self._loaded = 0
+        """The number of saved quizzes that have been loaded so far."""
+
     @dataclass
     class Changed(Message):
         """Message sent when the quiz list has been changed."""
@@ -58,36 +82,128 @@ class QuizList(OptionList):
         """The quiz list that was changed."""
 
     def _changed(self) -> None:
-        """Handle the list being changed."""
-        quizzes_file().write_text(
-            dumps(
-                [quiz.as_json for quiz in self.quizzes],
-                indent=4,
-                default=lambda x: x.value,
-            ),
-            encoding="utf-8",
-        )
+        """Handle the list being changed.
+
+        Note:
+            Saving is put off until the list has been left alone for
+            `SAVE_DELAY` seconds, so a burst of changes results in a single
+            save.
+        """
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(self.SAVE_DELAY, self._save)
         self.post_message(self.Changed(self))
 
+    def _save(self) -> None:
+        """Save the quizzes in the background."""
+        if self._loading:
+            # Saving now would lose the quizzes that are yet to be loaded,
+            # so hold off until they're all in.
+            self._save_timer = self.set_timer(self.SAVE_DELAY, self._save)
+            return
+        self._save_timer = None
+        self._generation += 1
+        self._write(list(self.quizzes), self._generation)
+
+    @work(thread=True, group="save-quizzes")
+    def _write(self, quizzes: list[QuizParameters], generation: int) -> None:
+        """Write a snapshot of the quizzes.
+
+        Args:
+            quizzes: The snapshot of the quizzes to write.
+            generation: The generation of the snapshot.
+
+        Note:
+            If an earlier write was held up, a later one may have already
+            written newer quizzes; in which case the snapshot is dropped.
+        """
+        with self._saving:
+            if generation > self._written:
+                save_quizzes(quizzes)
+                self._written = generation
+
+    @on(Unmount)
+    def _flush(self) -> None:
+        """Make sure any pending save happens before the list goes away.
+
+        Note:
+            If there are changes to save but the saved quizzes haven't all
+            been loaded yet, the rest of them are loaded first so that they
+            aren't lost.
+        """
+        if self._loading and self._save_timer is not None:
+            self._finish_loading_now()
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+            self._generation += 1
+        # Whether the save was still waiting on its timer or a write is yet
+        # to finish, the latest snapshot is the quizzes as they are now.
+        quizzes, generation = list(self.quizzes), self._generation
+        with self._saving:
+            if generation > self._written:
+                save_quizzes(quizzes)
+                self._written = generation
+
     @on(Mount)
+    @work(thread=True, exclusive=True, group="load-quizzes")
     def _load(self) -> None:
-        """Load the current quiz list."""
+        """Load the current quiz list.
+
+        Note:
+            The quizzes are read and parsed in a thread, and are added to
+            the list a batch at a time as they're parsed.
+        """
         try:
-            self.quizzes = [
-                QuizParameters(**quiz)
-                for quiz in loads(quizzes_file().read_text(encoding="utf-8"))
-            ]
+            for batch in load_quiz_batches(self.LOAD_BATCH_SIZE):
+                self.app.call_from_thread(self._add_loaded, batch)
         except FileNotFoundError:
-            pass
+            self.app.call_from_thread(self._finish_loading, False)
         else:
-            self.post_message(self.Changed(self))
+            self.app.call_from_thread(self._finish_loading, True)
+
+    def _add_loaded(self, quizzes: list[QuizParameters]) -> None:
+        """Add a batch of loaded quizzes to the list.
 
-    def _watch_quizzes(self) -> None:
-        """Refresh the prompt list when the quiz list is reassigned."""
-        self.clear_options().add_options([quiz.title for quiz in self.quizzes])
-        if self.quizzes:
+        Args:
+            quizzes: The quizzes to add.
+        """
+        if not self._loading:
+            # Loading was finished off early; this batch is already in.
+            return
+        self.quizzes.extend(quizzes)
+        self._loaded += len(quizzes)
+        self.add_options([quiz.title for quiz in quizzes])
+        if self.highlighted is None:
             self.highlighted = 0
 
+    def _finish_loading(self, loaded: bool) -> None:
+        """Finish off loading the quizzes.
+
+        Args:
+            loaded: Were there saved quizzes to load?
+        """
+        if not self._loading:
+            # Loading was finished off early; there's nothing more to do.
+            return
+        self._loading = False
+        if loaded:
+            self.post_message(self.Changed(self))
+
+    def _finish_loading_now(self) -> None:
+        """Load the saved quizzes that are yet to be loaded, right away.
+
+        Note:
+            The quizzes are loaded from the file in order, and the file
+            isn't saved to while loading, so the quizzes yet to be loaded
+            are all of those after the ones already loaded.
+        """
+        try:
+            self.quizzes.extend(load_quizzes()[self._loaded :])
+        except FileNotFoundError:
+            pass
+        self._loading = False
+
     def add_quiz(self, quiz: QuizParameters) -> None:
         """Add a new quiz to the list.
 
@@ -0,0 +1,201 @@
+"""Provides a widget that shows the results of a quiz, one row per question."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from bisect import bisect_right
+from sys import maxsize
+from typing import Final, Sequence
+
+##############################################################################
+# Rich imports.
+from rich.text import Text
+
+##############################################################################
+# Textual imports.
+from textual.cache import LRUCache
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+##############################################################################
+# Local imports.
+from ...opentdb import Question
+
+##############################################################################
+Result = tuple[Question, str | None]
+"""A question and the answer that was given to it, if any."""
+
+
+##############################################################################
+class QuizResults(ScrollView, can_focus=True):
+    """Shows the result of each question in a quiz.
+
+    Only the rows that are scrolled into view are ever laid out and
+    rendered; each rendered row is cached. Rows that haven't been laid out
+    yet are assumed to be `ESTIMATED_ROW_HEIGHT` lines high when working
+    out how far the results can be scrolled.
+    """
+
+    DEFAULT_CSS = """
+    QuizResults {
+        background: $surface;
+        &:focus {
+            background-tint: $foreground 5%;
+        }
+    }
+    """
+
+    NUMBER_WIDTH: Final[int] = 6
+    """The width of the gutter that holds each question's number."""
+
+    ESTIMATED_ROW_HEIGHT: Final[int] = 3
+    """The number of lines a row is assumed to take until it's laid out."""
+
+    def __init__(  # pylint:disable=redefined-builtin
+        self,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Initialise the quiz results widget.
+
+        Args:
+            name: The name of the quiz results widget.
+            id: The ID of the quiz results widget in the DOM.
+            classes: The CSS classes of the quiz results widget.
+            disabled: Whether the quiz results widget is disabled or not.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._results: Sequence[Result] = ()
+        """The results to show."""
+        self._offsets: list[int] = []
+        """The line each laid-out row starts on, in order from the first."""
+        self._laid_out_to = 0
+        """The line just after the last row that has been laid out."""
+        self._rows: LRUCache[tuple[int, int], list[Strip]] = LRUCache(256)
+        """The cache of rendered rows, keyed by row and width.
+
+        The rows are cached without the widget's own style, which is applied
+        as each line is drawn, so that they don't go stale when it changes.
+        """
+
+    def show(self, results: Sequence[Result]) -> None:
+        """Show a set of results.
+
+        Args:
+            results: The results to show.
+        """
+        self._results = results
+        self._reset()
+
+    def _reset(self) -> None:
+        """Throw away any layout and rendering and start again."""
+        self._offsets = []
+        self._laid_out_to = 0
+        self._rows.clear()
+        self._update_virtual_size()
+        self.refresh()
+
+    def on_resize(self) -> None:
+        """Lay the rows out again when the width changes."""
+        self._reset()
+
+    @property
+    def _width(self) -> int:
+        """The width that rows are rendered at."""
+        return self.scrollable_content_region.width
+
+    def _render_row(self, row: int) -> list[Strip]:
+        """Render a row of the results.
+
+        Args:
+            row: The row to render.
+
+        Returns:
+            The lines of the rendered row.
+        """
+        width = self._width
+        if (strips := self._rows.get((row, width))) is not None:
+            return strips
+        question, given = self._results[row]
+        console = self.app.console
+        text_width = max(width - self.NUMBER_WIDTH, 1)
+        gutter = " " * self.NUMBER_WIDTH
+        lines = [
+            Text.assemble(
+                f"{row + 1}. ".rjust(self.NUMBER_WIDTH) if not line else gutter, text
+            )
+            for line, text in enumerate(
+                Text(question.question).wrap(console, text_width)
+            )
+        ]
+        answer = Text(
+            given or "(No answer given)",
+            style="green" if given == question.correct_answer else "red",
+        )
+        lines.extend(
+            Text.assemble(gutter, text) for text in answer.wrap(console, text_width)
+        )
+        lines.append(Text())
+        strips = [
+            Strip(line.render(console)).extend_cell_length(width) for line in lines
+        ]
+        self._rows[(row, width)] = strips
+        return strips
+
+    def _lay_out_to(self, line: int) -> None:
+        """Make sure that rows have been laid out down to a given line.
+
+        Args:
+            line: The line that needs to have been laid out.
+        """
+        laid_out = len(self._offsets)
+        while self._laid_out_to <= line and len(self._offsets) < len(self._results):
+            self._offsets.append(self._laid_out_to)
+            self._laid_out_to += len(self._render_row(len(self._offsets) - 1))
+        if len(self._offsets) != laid_out:
+            self.call_after_refresh(self._update_virtual_size)
+
+    def _update_virtual_size(self) -> None:
+        """Update the virtual size to reflect what's known of the rows."""
+        unmeasured = len(self._results) - len(self._offsets)
+        self.virtual_size = Size(
+            self._width, self._laid_out_to + unmeasured * self.ESTIMATED_ROW_HEIGHT
+        )
+
+    def action_scroll_end(self) -> None:
+        """Scroll to the end of the results.
+
+        Note:
+            The end can't be known until every row has been laid out, so
+            this is the one time that all of them are.
+        """
+        self._lay_out_to(maxsize)
+        self._update_virtual_size()
+        super().action_scroll_end()
+
+    def render_line(self, y: int) -> Strip:
+        """Render a line of the results.
+
+        Args:
+            y: The line of the widget to render.
+
+        Returns:
+            The rendered line.
+        """
+        line = self.scroll_offset.y + y
+        self._lay_out_to(line)
+        if line >= self._laid_out_to:
+            return Strip.blank(self._width, self.rich_style)
+        row = bisect_right(self._offsets, line) - 1
+        return self._render_row(row)[line - self._offsets[row]].apply_style(
+            self.rich_style
+        )
+
+
+### quiz_results.py ends here
@@ -0,0 +1,317 @@
+"""Command line tools for working with Quizzical's data without the UI."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from argparse import ArgumentParser, Namespace
+from contextlib import asynccontextmanager
+from json import dumps
+from sys import stderr, stdout
+from typing import TYPE_CHECKING, Any, AsyncIterator, Coroutine, Sequence, TextIO
+
+##############################################################################
+# Local imports.
+from . import __version__
+from .app.data import dump_stats, load_quizzes
+
+##############################################################################
+# Local imports for type checking.
+if TYPE_CHECKING:
+    from .opentdb import OpenTriviaDB
+
+##############################################################################
+# Note that nothing in here imports Textual, and asyncio and the API client
+# are only imported by the commands that need them; that way scripted use
+# starts quickly. This is also why the application package, and the data
+# code it shares with the commands, leave importing Textual and the client
+# until they're used.
+
+
+##############################################################################
+def _parser() -> ArgumentParser:
+    """Build the command line parser.
+
+    Returns:
+        The parser.
+    """
+    parser = ArgumentParser(
+        prog="quizzical",
+        description="A terminal-based trivia quiz. Run with no command to play.",
+    )
+    parser.add_argument(
+        "-v", "--version", action="version", version=f"%(prog)s v{__version__}"
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    commands.add_parser("quizzes", help="List the saved quizzes")
+
+    fetch = commands.add_parser(
+        "fetch",
+        help="Fetch questions and write them out as JSON Lines, "
+        "leaving the question pool alone",
+    )
+    fetch.add_argument("--quiz", help="The title of a saved quiz to fetch for")
+    fetch.add_argument(
+        "-n", "--amount", type=int, default=10, help="The number of questions"
+    )
+    fetch.add_argument("-c", "--category", type=int, help="The ID of the category")
+    fetch.add_argument(
+        "-d", "--difficulty", choices=("easy", "medium", "hard"), help="The difficulty"
+    )
+    fetch.add_argument(
+        "-t", "--type", choices=("multiple", "boolean"), help="The type of question"
+    )
+    fetch.add_argument(
+        "-o", "--output", help="The file to write to, rather than standard output"
+    )
+
+    counts = commands.add_parser("counts", help="Show the counts of questions")
+    counts.add_argument(
+        "-c",
+        "--category",
+        type=int,
+        help="Show the counts per difficulty for the category with this ID",
+    )
+
+    commands.add_parser(
+        "warm",
+        help="Fill in any missing or out of date cached data, "
+        "and top up the question pool for the quizzes",
+    )
+
+    return parser
+
+
+##############################################################################
+@asynccontextmanager
+async def _client(use_pool: bool = True) -> AsyncIterator[OpenTriviaDB]:
+    """Make the API client for the command line tools.
+
+    Args:
+        use_pool: Should the client use the local question pool?
+
+    Yields:
+        The client.
+
+    Note:
+        The client is closed once it's done with, and the statistics for
+        the calls it made are then dumped if they've been asked for.
+    """
+    from .app.data import trivia_client
+
+    def on_wait(wait: float) -> None:
+        if wait >= 1:
+            print(f"Waiting {wait:.0f}s for the Open Trivia DB...", file=stderr)
+
+    client = trivia_client(on_wait=on_wait, use_pool=use_pool)
+    try:
+        async with client:
+            yield client
+    finally:
+        dump_stats(client)
+
+
+##############################################################################
+def _run(command: Coroutine[Any, Any, None]) -> int:
+    """Run a command that talks to the Open Trivia DB.
+
+    Args:
+        command: The command to run.
+
+    Returns:
+        The exit code.
+    """
+    from asyncio import run
+
+    from .opentdb import NoResults, OpenTriviaDB
+
+    try:
+        run(command)
+    except NoResults:
+        print("quizzical: No matching questions were found", file=stderr)
+        return 1
+    except (LookupError, OpenTriviaDB.RequestError) as error:
+        print(f"quizzical: {error}", file=stderr)
+        return 1
+    return 0
+
+
+##############################################################################
+def _quizzes(_: Namespace) -> int:
+    """List the saved quizzes.
+
+    Returns:
+        The exit code.
+    """
+    try:
+        quizzes = load_quizzes()
+    except FileNotFoundError:
+        quizzes = []
+    for quiz in quizzes:
+        print(
+            "\t".join(
+                (
+                    quiz.title,
+                    f"{quiz.number_of_questions} questions",
+                    "any category"
+                    if quiz.category is None
+                    else f"category {quiz.category}",
+                    quiz.difficulty or "any difficulty",
+                    quiz.question_type or "any type",
+                )
+            )
+        )
+    return 0
+
+
+##############################################################################
+async def _write_questions(arguments: Namespace, output: TextIO) -> None:
+    """Fetch questions and write them out as JSON Lines.
+
+    Args:
+        arguments: The command line arguments.
+        output: The file to write the questions to.
+
+    Note:
+        The questions always come from the API; the question pool is kept
+        for the saved quizzes, so it's neither taken from nor added to.
+    """
+    amount, category = arguments.amount, arguments.category
+    difficulty, of_type = arguments.difficulty, arguments.type
+    if arguments.quiz is not None:
+        try:
+            quiz = next(quiz for quiz in load_quizzes() if quiz.title == arguments.quiz)
+        except (FileNotFoundError, StopIteration):
+            raise LookupError(
+                f"There is no saved quiz called {arguments.quiz!r}"
+            ) from None
+        amount, category = quiz.number_of_questions, quiz.category
+        difficulty, of_type = quiz.difficulty, quiz.question_type
+    async with _client(use_pool=False) as client:
+        async for batch in client.question_batches(
+            amount, category, difficulty, of_type
+        ):
+            output.writelines(f"{dumps(question.as_json)}\n" for question in batch)
+            output.flush()
+
+
+##############################################################################
+def _fetch(arguments: Namespace) -> int:
+    """Fetch questions and write them out as JSON Lines.
+
+    Args:
+        arguments: The command line arguments.
+
+    Returns:
+        The exit code.
+    """
+    if arguments.output is None:
+        return _run(_write_questions(arguments, stdout))
+    with open(arguments.output, "w", encoding="utf-8") as output:
+        return _run(_write_questions(arguments, output))
+
+
+##############################################################################
+async def _show_counts(arguments: Namespace) -> None:
+    """Show the counts of questions.
+
+    Args:
+        arguments: The command line arguments.
+    """
+    async with _client() as client:
+        if arguments.category is not None:
+            category = await client.category(arguments.category)
+            by_difficulty = await client.difficulty_counts(category)
+            print(f"{category.name}:")
+            print(f"  easy:   {by_difficulty.easy}")
+            print(f"  medium: {by_difficulty.medium}")
+            print(f"  hard:   {by_difficulty.hard}")
+            print(f"  total:  {by_difficulty.questions}")
+            return
+        overall = await client.overall_counts()
+        print(f"Questions: {overall.questions}")
+        print(f"Pending:   {overall.pending}")
+        print(f"Verified:  {overall.verified}")
+        print(f"Rejected:  {overall.rejected}")
+        per_category = await client.category_counts()
+        for category in await client.categories():
+            if (counts := per_category.get(category.id)) is not None:
+                print(f"{category.id:>4}\t{counts.verified:>6}\t{category.name}")
+
+
+##############################################################################
+def _counts(arguments: Namespace) -> int:
+    """Show the counts of questions.
+
+    Args:
+        arguments: The command line arguments.
+
+    Returns:
+        The exit code.
+    """
+    return _run(_show_counts(arguments))
+
+
+##############################################################################
+async def _warm_up() -> None:
+    """Fill in missing or stale cached data, and top up the question pool.
+
+    Note:
+        Cached data that's still fresh is left as it is.
+    """
+    from .app.data import warm_pool
+
+    def on_progress(topped_up: int, to_top_up: int) -> None:
+        if topped_up < to_top_up:
+            print(f"Topping up {topped_up + 1} of {to_top_up}...", file=stderr)
+
+    try:
+        quizzes = load_quizzes()
+    except FileNotFoundError:
+        quizzes = []
+    async with _client() as client:
+        await client.categories()
+        await client.overall_counts()
+        await warm_pool(client, quizzes, on_progress, wait_for_idle=False)
+        print(f"{await client.pooled()} questions ready to ask")
+
+
+##############################################################################
+def _warm(_: Namespace) -> int:
+    """Fill in missing or stale cached data, and top up the question pool.
+
+    Returns:
+        The exit code.
+    """
+    return _run(_warm_up())
+
+
+##############################################################################
+def main(argv: Sequence[str] | None = None) -> int:
+    """Main entry point for the command line.
+
+    Args:
+        argv: The command line arguments, or `None` to use those given to
+            the program.
+
+    Returns:
+        The exit code.
+    """
+    arguments = _parser().parse_args(argv)
+    if arguments.command is None:
+        from .app import Quizzical
+
+        Quizzical().run()
+        return 0
+    return {
+        "quizzes": _quizzes,
+        "fetch": _fetch,
+        "counts": _counts,
+        "warm": _warm,
+    }[arguments.command](arguments)
+
+
+### cli.py ends here
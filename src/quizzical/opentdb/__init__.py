@@ -2,10 +2,14 @@
 
 ##############################################################################
 # Local imports.
+from .cache import ResponseCache
 from .category import Category
+from .circuit_breaker import CircuitBreaker, CircuitState
 from .client import OpenTriviaDB
-from .counts import Counts
+from .counts import Counts, DifficultyCounts
+from .pool import QuestionPool
 from .question import Difficulty, Question, Type
+from .rate_limit import RateLimiter
 from .response import (
     Code,
     InvalidParameter,
@@ -14,19 +18,29 @@ from .response import (
     TokenEmpty,
     TokenNotFound,
 )
+from .stats import LatencyHistogram, ModuleStats, Stats
 
 ##############################################################################
 # Exports.
 __all__ = [
     "Category",
+    "CircuitBreaker",
+    "CircuitState",
     "Code",
     "Counts",
     "Difficulty",
+    "DifficultyCounts",
     "InvalidParameter",
+    "LatencyHistogram",
+    "ModuleStats",
     "NoResults",
     "OpenTriviaDB",
     "Question",
+    "QuestionPool",
     "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "Stats",
     "TokenEmpty",
     "TokenNotFound",
     "Type",
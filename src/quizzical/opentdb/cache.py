@@ -0,0 +1,79 @@
+"""Provides a simple on-disk cache of API responses."""
+
+##############################################################################
+# Python imports.
+from pathlib import Path
+from time import time
+
+
+##############################################################################
+class ResponseCache:
+    """An on-disk cache of the text of API responses."""
+
+    def __init__(self, directory: Path, ttl: float) -> None:
+        """Initialise the response cache.
+
+        Args:
+            directory: The directory to keep the cached responses in.
+            ttl: The number of seconds a cached response stays fresh for.
+        """
+        self._directory = directory
+        """The directory to keep the cached responses in."""
+        self._ttl = ttl
+        """The number of seconds a cached response stays fresh for."""
+
+    def _file(self, name: str) -> Path:
+        """Get the file that a response is cached in.
+
+        Args:
+            name: The name of the cached response.
+
+        Returns:
+            The path to the file.
+        """
+        return self._directory / f"{name}.json"
+
+    def age(self, name: str) -> float | None:
+        """Get the age of a cached response.
+
+        Args:
+            name: The name of the cached response.
+
+        Returns:
+            The age of the response in seconds, or `None` if it isn't cached.
+        """
+        try:
+            return time() - self._file(name).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def get(self, name: str, allow_stale: bool = False) -> str | None:
+        """Get a cached response.
+
+        Args:
+            name: The name of the cached response.
+            allow_stale: Can a response that is no longer fresh be returned?
+
+        Returns:
+            The text of the cached response, or `None` if there isn't one.
+        """
+        if (age := self.age(name)) is None or (age > self._ttl and not allow_stale):
+            return None
+        try:
+            return self._file(name).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, name: str, text: str) -> None:
+        """Cache a response.
+
+        Args:
+            name: The name of the response.
+            text: The text of the response.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        (staging := self._file(f"{name}.new")).write_text(text, encoding="utf-8")
+        staging.replace(self._file(name))
+
+
+### cache.py ends here
@@ -4,10 +4,11 @@
 # Python imports.
 from dataclasses import dataclass
 from html import unescape
+from sys import intern
 
 
 ##############################################################################
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Category:
     """Class that holds the details of a quiz category."""
 
@@ -19,7 +20,7 @@ class Category:
 
     def __post_init__(self) -> None:
         """Tidy up the question data once it's been loaded up."""
-        self.name = unescape(self.name)
+        object.__setattr__(self, "name", intern(unescape(self.name)))
 
 
 ### category.py ends here
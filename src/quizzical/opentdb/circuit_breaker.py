@@ -0,0 +1,124 @@
+"""Provides a circuit breaker for failing fast while the API is down."""
+
+##############################################################################
+# Python imports.
+from enum import Enum
+from time import monotonic
+
+
+##############################################################################
+class CircuitState(Enum):
+    """The states a circuit breaker can be in."""
+
+    CLOSED = "closed"
+    """Calls are being made as normal."""
+
+    OPEN = "open"
+    """Calls are failing fast without being made."""
+
+    HALF_OPEN = "half-open"
+    """A single call is being let through to see if things have recovered."""
+
+
+##############################################################################
+class CircuitBreaker:
+    """Tracks failures and decides if calls should be made at all.
+
+    After `failure_threshold` failures in a row the circuit opens and calls
+    fail fast. Once `reset_timeout` seconds have passed the circuit
+    half-opens and lets a single call through as a probe; if it works the
+    circuit closes again, if it fails the circuit opens again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30) -> None:
+        """Initialise the circuit breaker.
+
+        Args:
+            failure_threshold: The number of failures in a row that opens
+                the circuit.
+            reset_timeout: The number of seconds the circuit stays open
+                before letting a probe through.
+        """
+        self._failure_threshold = failure_threshold
+        """The number of failures in a row that opens the circuit."""
+        self._reset_timeout = reset_timeout
+        """The number of seconds the circuit stays open before a probe."""
+        self._failures = 0
+        """The number of failures in a row."""
+        self._opened_at: float | None = None
+        """The monotonic time at which the circuit was last opened."""
+        self._probe: object | None = None
+        """The caller whose probe call is currently in flight, if any."""
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self.retry_in:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """The number of seconds until the circuit will let a probe through."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - monotonic())
+
+    def allow(self, caller: object) -> bool:
+        """Should a call be made?
+
+        Args:
+            caller: The caller that wants to make the call.
+
+        Returns:
+            `True` if the call should be made, `False` if it should fail
+            fast.
+
+        Note:
+            When the circuit is half-open, the first caller to ask is the
+            probe; everyone else is told to fail fast until the probe has
+            reported back.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and self._probe is None:
+            self._probe = caller
+            return True
+        return False
+
+    def success(self) -> None:
+        """Record that a call succeeded."""
+        self._failures = 0
+        self._opened_at = None
+        self._probe = None
+
+    def abandon(self, caller: object) -> None:
+        """Record that a call was given up on before it could report back.
+
+        Args:
+            caller: The caller that gave up on the call.
+
+        Note:
+            If the caller was the probe, another probe can be let through.
+        """
+        if caller is self._probe:
+            self._probe = None
+
+    def failure(self, caller: object) -> None:
+        """Record that a call failed.
+
+        Args:
+            caller: The caller whose call failed.
+        """
+        self._failures += 1
+        probe_failed = caller is self._probe
+        if probe_failed or self._failures >= self._failure_threshold:
+            self._opened_at = monotonic()
+        if probe_failed:
+            self._probe = None
+
+
+### circuit_breaker.py ends here
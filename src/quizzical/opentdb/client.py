@@ -6,19 +6,36 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
+from asyncio import CancelledError, sleep, to_thread
+from copy import deepcopy
 from json import loads
-from typing import Final
+from pathlib import Path
+from random import uniform
+from time import perf_counter
+from types import TracebackType
+from typing import Any, AsyncIterator, Callable, Final
 
 ##############################################################################
 # HTTPX imports.
-from httpx import AsyncClient, HTTPStatusError, RequestError
+from httpx import AsyncClient, HTTPStatusError, Limits, RequestError, Timeout, codes
+
+##############################################################################
+# Backward-compatible typing.
+from typing_extensions import Self
 
 ##############################################################################
 # Local imports.
+from .cache import ResponseCache
 from .category import Category
-from .counts import Counts
+from .circuit_breaker import CircuitBreaker
+from .counts import Counts, DifficultyCounts
+from .encoding import ApiEncoding
+from .pool import QuestionPool
 from .question import Difficulty, Question, Type
-from .response import Code
+from .rate_limit import RateLimiter
+from .response import Code, NoResults, TokenEmpty, TokenNotFound
+from .single_flight import SingleFlight
+from .stats import Stats
 
 
 ##############################################################################
@@ -31,67 +48,515 @@ class OpenTriviaDB:
     _BASE: Final[str] = "https://opentdb.com/"
     """The base of the URL for the API."""
 
+    RATE_LIMIT_INTERVAL: Final[float] = 5.0
+    """The minimum number of seconds between calls to the API."""
+
+    RATE_LIMIT_RETRIES: Final[int] = 3
+    """The number of times to retry a call that hit the rate limit."""
+
+    MAX_QUESTIONS_PER_CALL: Final[int] = 50
+    """The maximum number of questions the API will serve in one call."""
+
+    DEFAULT_LIMITS: Final[Limits] = Limits(
+        max_connections=4, max_keepalive_connections=2, keepalive_expiry=30
+    )
+    """The default connection pool limits.
+
+    Keep-alive connections are kept around for longer than the rate limit
+    interval so that consecutive calls can reuse the same connection.
+    """
+
+    DEFAULT_TIMEOUT: Final[Timeout] = Timeout(15, connect=5)
+    """The default timeouts for calls to the API."""
+
+    RETRIES: Final[int] = 2
+    """The number of times to retry a call that failed in a transient way."""
+
+    BACKOFF_BASE: Final[float] = 0.5
+    """The base number of seconds for the backoff between retries."""
+
+    BACKOFF_CAP: Final[float] = 8.0
+    """The most number of seconds to back off between retries."""
+
+    _WAIT_THRESHOLD: Final[float] = 0.01
+    """Seconds held back by the rate limiter before it counts as a wait."""
+
+    _RATE_LIMITED: Final[str] = (
+        "The Open Trivia DB is being called too often; please try again shortly"
+    )
+    """The message used when the API keeps on saying it's called too often."""
+
     class RequestError(Exception):
         """Exception raised if there was a problem making an API request."""
 
-    def __init__(self) -> None:
-        """Initialise the API client object."""
+    class CircuitOpen(RequestError):
+        """Exception raised if calls are being failed fast."""
+
+    class RateLimited(RequestError):
+        """Exception raised if the API won't stop saying it's called too often."""
+
+    class UnknownCategory(LookupError):
+        """Exception raised if a category can't be found."""
+
+    def __init__(
+        self,
+        on_wait: Callable[[float], None] | None = None,
+        token_file: Path | None = None,
+        pool: QuestionPool | None = None,
+        cache: ResponseCache | None = None,
+        limits: Limits = DEFAULT_LIMITS,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        encoding: ApiEncoding = "html",
+    ) -> None:
+        """Initialise the API client object.
+
+        Args:
+            on_wait: Optional callback that is told how many seconds a call
+                will be held back to stay within the API's rate limit.
+            token_file: Optional file in which to keep the session token
+                between runs.
+            pool: Optional local pool of questions to serve from, and to
+                keep fetched questions in.
+            cache: Optional on-disk cache for responses that rarely change.
+            limits: The connection pool limits to use.
+            timeout: The timeouts to use for calls to the API.
+            http2: Should HTTP/2 be used? This needs the `h2` package to be
+                installed, which comes with the `http2` extra.
+            encoding: The encoding to ask the API to use for question text.
+                Questions are only decoded as they're used, whatever the
+                encoding; the API's own `html` encoding is the default as
+                text without entities decodes to itself, so it takes the
+                least memory once decoded.
+        """
         self._client_: AsyncClient | None = None
         """The HTTPX client."""
+        self._limits = limits
+        """The connection pool limits to use."""
+        self._timeout = timeout
+        """The timeouts to use for calls to the API."""
+        self._http2 = http2
+        """Should HTTP/2 be used?"""
+        self._encoding: ApiEncoding = encoding
+        """The encoding to ask the API to use for question text."""
+        self._token_file = token_file
+        """The file in which the session token is kept, if there is one."""
+        self._token: str | None = None
+        """The session token."""
+        self._pool = pool
+        """The local pool of questions, if there is one."""
+        self._cache = cache
+        """The on-disk cache of responses, if there is one."""
+        self._rate_limiter = RateLimiter(self.RATE_LIMIT_INTERVAL, on_wait)
+        """The scheduler that keeps calls within the API's rate limit."""
+        self._single_flight = SingleFlight()
+        """Used to share in-flight calls between identical callers."""
+        self._circuit = CircuitBreaker()
+        """The circuit breaker that fails calls fast while the API is down."""
+        self._stats = Stats()
+        """The statistics about calls made to the API."""
         self._categories: list[Category] = []
         """The list of categories."""
+        self._categories_by_id: dict[int, Category] = {}
+        """The categories, indexed by their ID."""
+        self._category_ids: dict[str, int] = {}
+        """The IDs of the categories, indexed by their name."""
         self._overall_counts: Counts | None = None
         """The overall counts of questions in the backend."""
         self._category_counts: dict[int, Counts] = {}
         """The question counts per category."""
+        self._difficulty_counts: dict[int, DifficultyCounts] = {}
+        """The question counts per difficulty, per category."""
 
     @property
     def _client(self) -> AsyncClient:
         """The API client."""
         if self._client_ is None:
-            self._client_ = AsyncClient()
+            self._client_ = AsyncClient(
+                base_url=self._BASE,
+                headers={"user-agent": self.AGENT},
+                limits=self._limits,
+                timeout=self._timeout,
+                http2=self._http2,
+            )
         return self._client_
 
+    async def aclose(self) -> None:
+        """Close the client, releasing any connections it holds."""
+        if self._client_ is not None:
+            await self._client_.aclose()
+            self._client_ = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def stats(self) -> Stats:
+        """Get the statistics about calls made to the API.
+
+        Returns:
+            A snapshot of the statistics, keyed by API module.
+        """
+        return deepcopy(self._stats)
+
+    @property
+    def circuit(self) -> CircuitBreaker:
+        """The circuit breaker that fails calls fast while the API is down."""
+        return self._circuit
+
+    async def probe(self) -> None:
+        """Check that the API can be reached.
+
+        Raises:
+            RequestError: If the API can't be reached.
+        """
+        await self._call("api_category")
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """The scheduler that keeps calls within the API's rate limit."""
+        return self._rate_limiter
+
     async def _call(self, module: str, **params: str) -> str:
         """Call on the OpenTDB API.
 
         Args:
-            path: The path for the API call.
+            module: The API module to call.
             params: The parameters for the call.
 
         Returns:
             The text returned from the call.
+
+        Note:
+            Identical calls that are made while one is already in flight
+            share that call and its result. The exception to this is calls
+            for questions, where each caller should get questions of their
+            own.
+        """
+        if module == "api":
+            return await self._make_call(module, **params)
+        return await self._single_flight.call(
+            (module, *sorted(params.items())),
+            lambda: self._make_call(module, **params),
+        )
+
+    async def _make_call(self, module: str, **params: str) -> str:
+        """Make a call to the OpenTDB API.
+
+        Args:
+            module: The API module to call.
+            params: The parameters for the call.
+
+        Returns:
+            The text returned from the call.
+
+        Raises:
+            RateLimited: If the API still said we were calling it too often
+                after the permitted number of retries.
+            CircuitOpen: If the API has been failing and calls are being
+                failed fast for the moment.
+
+        Note:
+            Calls are queued and spaced out so that they stay within the
+            API's rate limit; this means that a call may be held back for
+            a few seconds before it is made.
+
+            Calls that fail in a way that might be transient (a problem
+            connecting, or an error on the server) are retried with a
+            jittered exponential backoff. Repeated failures open the
+            circuit breaker.
+        """
+        stats = self._stats[module]
+        caller = object()
+        rate_limited = 0
+        failures = 0
+        while True:
+            if not self._circuit.allow(caller):
+                raise self.CircuitOpen(
+                    "The Open Trivia DB seems to be unavailable; "
+                    f"will try again in {self._circuit.retry_in:.0f} seconds"
+                )
+
+            if rate_limited or failures:
+                stats.retries += 1
+
+            try:
+                queued = perf_counter()
+                await self._rate_limiter.slot()
+                if (started := perf_counter()) - queued > self._WAIT_THRESHOLD:
+                    stats.rate_limit_waits += 1
+                    stats.rate_limit_wait_time += started - queued
+                stats.requests += 1
+                response = await self._client.get(f"{module}.php", params=params)
+            except RequestError as error:
+                stats.errors += 1
+                problem = str(error)
+            except CancelledError:
+                self._circuit.abandon(caller)
+                raise
+            else:
+                stats.latency.record(perf_counter() - started)
+                stats.bytes_received += len(response.content)
+                if not response.is_error:
+                    self._circuit.success()
+                    return response.text
+                stats.errors += 1
+                if not response.is_server_error:
+                    # Anything short of a server error means the API is up
+                    # and talking to us.
+                    self._circuit.success()
+                    if response.status_code == codes.TOO_MANY_REQUESTS:
+                        self._rate_limiter.back_off()
+                        if (rate_limited := rate_limited + 1) > self.RATE_LIMIT_RETRIES:
+                            raise self.RateLimited(self._RATE_LIMITED)
+                        continue
+                    try:
+                        response.raise_for_status()
+                    except HTTPStatusError as error:
+                        raise self.RequestError(str(error))
+                problem = f"Server error {response.status_code} from {response.url}"
+
+            self._circuit.failure(caller)
+            if (failures := failures + 1) > self.RETRIES:
+                raise self.RequestError(problem)
+            await sleep(
+                uniform(
+                    0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** (failures - 1))
+                )
+            )
+
+    async def _api(self, module: str = "api", /, **params: str) -> dict[str, Any]:
+        """Call on an API module that gives a response code, checking it.
+
+        Args:
+            module: The API module to call.
+            params: The parameters for the call.
+
+        Returns:
+            The decoded response from the API.
+
+        Raises:
+            RateLimited: If the API still said we were calling it too often
+                after the permitted number of retries.
+
+        Note:
+            Any other response code that isn't a success will result in
+            the corresponding exception being raised.
         """
+        for _ in range(self.RATE_LIMIT_RETRIES + 1):
+            response: dict[str, Any] = loads(await self._call(module, **params))
+            if (
+                code := Code(response.get("response_code", Code.UNKNOWN))
+            ) is Code.RATE_LIMIT:
+                self._rate_limiter.back_off()
+                self._stats[module].retries += 1
+                continue
+            code.maybe_raise()
+            return response
+        raise self.RateLimited(self._RATE_LIMITED)
+
+    def _remember_token(self, token: str | None) -> None:
+        """Remember the given session token.
+
+        Args:
+            token: The token to remember, or `None` to forget the token.
+        """
+        self._token = token
+        if self._token_file is not None:
+            if token is None:
+                self._token_file.unlink(missing_ok=True)
+            else:
+                self._token_file.write_text(token, encoding="utf-8")
+
+    async def _session_token(self) -> str:
+        """Get the session token, requesting one if need be.
+
+        Returns:
+            The session token.
+        """
+        if self._token is None and self._token_file is not None:
+            try:
+                self._token = (
+                    self._token_file.read_text(encoding="utf-8").strip() or None
+                )
+            except FileNotFoundError:
+                pass
+        if self._token is None:
+            response = await self._api("api_token", command="request")
+            self._remember_token(response["token"])
+        assert self._token is not None
+        return self._token
+
+    async def _reset_session_token(self) -> None:
+        """Reset the session token so that it can serve all questions again."""
         try:
-            response = await self._client.get(
-                f"{self._BASE}/{module}.php",
-                params=params,
-                headers={"user-agent": self.AGENT},
+            response = await self._api(
+                "api_token", command="reset", token=await self._session_token()
             )
-        except RequestError as error:
-            raise self.RequestError(str(error))
+        except TokenNotFound:
+            self._remember_token(None)
+        else:
+            self._remember_token(response["token"])
+
+    async def _questions(self, **params: str) -> list[Question]:
+        """Call on the question API using the session token.
+
+        Args:
+            params: The parameters for the call.
+
+        Returns:
+            The questions returned by the API.
+
+        Note:
+            If the session token is unknown to the API a new one is
+            requested; if it has run out of questions it is reset. Either
+            way the call is then tried again.
+
+            The questions are asked for in the client's chosen encoding,
+            and are left encoded until they're used.
+        """
+        if self._encoding != "html":
+            params["encode"] = self._encoding
+        try:
+            response = await self._api(token=await self._session_token(), **params)
+        except TokenNotFound:
+            self._remember_token(None)
+        except TokenEmpty:
+            await self._reset_session_token()
+        else:
+            return self._parse_questions(response)
+        return self._parse_questions(
+            await self._api(token=await self._session_token(), **params)
+        )
+
+    def _parse_questions(self, response: dict[str, Any]) -> list[Question]:
+        """Parse the questions out of an API response.
+
+        Args:
+            response: The decoded response from the API.
+
+        Returns:
+            The questions, still encoded.
+        """
+        return [
+            Question.from_api(question, self._encoding)
+            for question in response["results"]
+        ]
+
+    @staticmethod
+    def _cache_name(module: str, **params: str) -> str:
+        """Get the name under which a response is cached.
+
+        Args:
+            module: The API module that was called.
+            params: The parameters for the call.
 
+        Returns:
+            The name to cache the response under.
+        """
+        return "-".join([module, *(f"{key}_{params[key]}" for key in sorted(params))])
+
+    async def _cached_call(self, module: str, **params: str) -> str:
+        """Call on the OpenTDB API, going via the on-disk cache.
+
+        Args:
+            module: The API module to call.
+            params: The parameters for the call.
+
+        Returns:
+            The text returned from the call.
+
+        Note:
+            If there's a fresh response in the cache that will be used
+            rather than calling the API. If the API can't be called and
+            there's a stale response in the cache, that will be used
+            instead.
+        """
+        if self._cache is None:
+            self._stats[module].cache_misses += 1
+            return await self._call(module, **params)
+        if (
+            text := self._cache.get(name := self._cache_name(module, **params))
+        ) is not None:
+            self._stats[module].cache_hits += 1
+            return text
+        self._stats[module].cache_misses += 1
         try:
-            response.raise_for_status()
-        except HTTPStatusError as error:
-            raise self.RequestError(str(error))
+            text = await self._call(module, **params)
+        except self.RequestError:
+            if (text := self._cache.get(name, allow_stale=True)) is None:
+                raise
+        else:
+            self._cache.put(name, text)
+        return text
 
-        return response.text
+    def _cached(self, module: str) -> str | None:
+        """Get a cached response, no matter how old it is.
+
+        Args:
+            module: The API module to get the cached response for.
+
+        Returns:
+            The text of the cached response, or `None` if there isn't one.
+        """
+        return None if self._cache is None else self._cache.get(module, True)
+
+    @staticmethod
+    def _parse_categories(text: str) -> list[Category]:
+        """Parse the categories out of an API response.
+
+        Args:
+            text: The text of the response.
+
+        Returns:
+            The categories.
+        """
+        return [Category(**category) for category in loads(text)["trivia_categories"]]
 
     async def categories(self) -> list[Category]:
         """Get the list of quiz categories.
 
         Returns:
             The list of quiz categories.
+
+        Note:
+            If the client has an on-disk cache the list is kept in there
+            between runs.
         """
         if self._categories:
+            self._stats["api_category"].cache_hits += 1
             return self._categories
-        self._categories = [
-            Category(**category)
-            for category in loads(await self._call("api_category"))["trivia_categories"]
-        ]
+        self._categories = self._parse_categories(
+            await self._cached_call("api_category")
+        )
+        self._categories_by_id = {
+            category.id: category for category in self._categories
+        }
+        self._category_ids = {
+            category.name: category.id for category in self._categories
+        }
         return self._categories
 
+    def cached_categories(self) -> list[Category] | None:
+        """Get the list of quiz categories without calling the API.
+
+        Returns:
+            The most recent list of categories that is to hand, no matter
+            how old it is, or `None` if there isn't one.
+        """
+        if self._categories:
+            return self._categories
+        if (text := self._cached("api_category")) is None:
+            return None
+        return self._parse_categories(text)
+
     async def category(self, category_id: int) -> Category:
         """Get a category based on its ID.
 
@@ -100,11 +565,241 @@ class OpenTriviaDB:
 
         Returns:
             The category data.
+
+        Raises:
+            UnknownCategory: If there is no category with that ID.
+        """
+        if not self._categories:
+            await self.categories()
+        try:
+            return self._categories_by_id[category_id]
+        except KeyError:
+            raise self.UnknownCategory(f"No category with ID {category_id}") from None
+
+    async def category_id(self, name: str) -> int:
+        """Get the ID of a category based on its name.
+
+        Args:
+            name: The name of the category, as given for a question.
+
+        Returns:
+            The ID of the category.
+
+        Raises:
+            UnknownCategory: If there is no category with that name.
+        """
+        if not self._categories:
+            await self.categories()
+        try:
+            return self._category_ids[name]
+        except KeyError:
+            raise self.UnknownCategory(f"No category called {name!r}") from None
+
+    @staticmethod
+    def _question_params(
+        category: int | Category | None,
+        difficulty: Difficulty | None,
+        of_type: Type | None,
+    ) -> dict[str, str]:
+        """Build the API parameters for asking for a particular kind of question.
+
+        Args:
+            category: The category of questions to ask for.
+            difficulty: The difficulty of questions to ask for.
+            of_type: The type of question to ask for.
+
+        Returns:
+            The parameters for the API call.
+        """
+        params: dict[str, str] = {}
+        if category is not None:
+            params["category"] = str(
+                category.id if isinstance(category, Category) else category
+            )
+        if difficulty is not None:
+            params["difficulty"] = difficulty
+        if of_type is not None:
+            params["type"] = of_type
+        return params
+
+    async def _pool_criteria(
+        self,
+        category: int | Category | None,
+        difficulty: Difficulty | None,
+        of_type: Type | None,
+    ) -> tuple[str | None, Difficulty | None, Type | None] | None:
+        """Build the criteria for finding a particular kind of question in the pool.
+
+        Args:
+            category: The category of questions to find.
+            difficulty: The difficulty of questions to find.
+            of_type: The type of question to find.
+
+        Returns:
+            The criteria for the pool, or `None` if the category is unknown.
+
+        Note:
+            The pool knows categories by name rather than ID, so a category
+            that can't be found can't have any questions in the pool.
         """
-        return next(
-            category
-            for category in await self.categories()
-            if category.id == category_id
+        if isinstance(category, int):
+            try:
+                category = await self.category(category)
+            except self.UnknownCategory:
+                return None
+        return None if category is None else category.name, difficulty, of_type
+
+    async def question_batches(
+        self,
+        amount: int = 10,
+        category: int | Category | None = None,
+        difficulty: Difficulty | None = None,
+        of_type: Type | None = None,
+    ) -> AsyncIterator[list[Question]]:
+        """Get a collection of questions from the API, a batch at a time.
+
+        Args:
+            amount: The amount of questions to get.
+            category: The category of questions to get.
+            difficulty: The difficulty of questions to get.
+            of_type: The type of question to get.
+
+        Yields:
+            Batches of questions, as they arrive from the API.
+
+        Raises:
+            NoResults: If the API has no questions at all for the request.
+
+        Note:
+            If there is a local pool of questions, any that have yet to be
+            served are used first, and the API is only called on to make up
+            the shortfall; anything fetched is added to the pool. If the API
+            can't be reached, questions that have been served before are
+            taken from the pool instead.
+
+            The API will only serve up to `MAX_QUESTIONS_PER_CALL` questions
+            at once, so larger requests are split over several calls, each
+            of which is subject to the rate limit. Any question that has
+            already been served in an earlier batch is dropped. If the API
+            runs out of questions part way through the collection will be
+            shorter than was asked for.
+
+            A session token is used to avoid being served the same question
+            twice. The token is requested, renewed and reset as needed.
+        """
+
+        if isinstance(category, Category):
+            category = category.id
+
+        params = self._question_params(category, difficulty, of_type)
+        seen: set[tuple[str, str]] = set()
+
+        def unseen(questions: list[Question]) -> list[Question]:
+            batch: list[Question] = []
+            for question in questions:
+                if question.key not in seen:
+                    seen.add(question.key)
+                    batch.append(question)
+            return batch
+
+        pool_criteria = (
+            None
+            if self._pool is None
+            else await self._pool_criteria(category, difficulty, of_type)
+        )
+        if self._pool is not None and pool_criteria is not None:
+            if batch := unseen(
+                await to_thread(self._pool.take, amount, *pool_criteria)
+            ):
+                yield batch
+
+        while (remaining := amount - len(seen)) > 0:
+            try:
+                fetched = await self._questions(
+                    amount=str(min(remaining, self.MAX_QUESTIONS_PER_CALL)), **params
+                )
+            except NoResults:
+                if seen:
+                    return
+                raise
+            except self.RequestError:
+                # We can't get to the API right now; so if there's a pool
+                # of questions fall back to serving ones that have been
+                # asked before.
+                if self._pool is None or pool_criteria is None:
+                    raise
+                if batch := unseen(
+                    await to_thread(
+                        self._pool.take,
+                        amount,
+                        *pool_criteria,
+                        include_served=True,
+                    )
+                )[:remaining]:
+                    yield batch
+                    return
+                raise
+            if not (batch := unseen(fetched)):
+                return
+            if self._pool is not None:
+                await to_thread(self._pool.add, batch, served=True)
+            yield batch
+
+    async def pooled(
+        self,
+        category: int | Category | None = None,
+        difficulty: Difficulty | None = None,
+        of_type: Type | None = None,
+    ) -> int:
+        """Get the number of questions in the local pool yet to be served.
+
+        Args:
+            category: The category of questions to count.
+            difficulty: The difficulty of questions to count.
+            of_type: The type of question to count.
+
+        Returns:
+            The number of matching questions; this is always zero if there
+            is no local pool.
+        """
+        if self._pool is None:
+            return 0
+        if (
+            pool_criteria := await self._pool_criteria(category, difficulty, of_type)
+        ) is None:
+            return 0
+        return await to_thread(self._pool.available, *pool_criteria)
+
+    async def prefetch(
+        self,
+        amount: int = 10,
+        category: int | Category | None = None,
+        difficulty: Difficulty | None = None,
+        of_type: Type | None = None,
+    ) -> int:
+        """Fetch questions from the API into the local pool.
+
+        Args:
+            amount: The amount of questions to fetch.
+            category: The category of questions to fetch.
+            difficulty: The difficulty of questions to fetch.
+            of_type: The type of question to fetch.
+
+        Returns:
+            The number of questions that were new to the pool.
+
+        Note:
+            At most `MAX_QUESTIONS_PER_CALL` questions will be fetched, and
+            nothing will be fetched if there is no local pool.
+        """
+        if self._pool is None:
+            return 0
+        return await to_thread(
+            self._pool.add,
+            await self._questions(
+                amount=str(min(amount, self.MAX_QUESTIONS_PER_CALL)),
+                **self._question_params(category, difficulty, of_type),
+            ),
         )
 
     async def questions(
@@ -124,40 +819,36 @@ class OpenTriviaDB:
 
         Returns:
             The questions.
-        """
 
-        if isinstance(category, Category):
-            category = category.id
-
-        params = {"amount": str(amount)}
-        if category is not None:
-            params["category"] = str(category)
-        if difficulty is not None:
-            params["difficulty"] = difficulty
-        if of_type is not None:
-            params["type"] = of_type
-
-        response = loads(await self._call("api", **params))
+        Note:
+            See `question_batches` for details of how large requests are
+            handled.
+        """
+        return [
+            question
+            async for batch in self.question_batches(
+                amount, category, difficulty, of_type
+            )
+            for question in batch
+        ]
 
-        # TODO: for things like invalid or exhausted tokens, or a rate
-        # limit, bounce back around, perhaps. For now though just do a
-        # simple sanity check.
-        Code(response.get("response_code", Code.UNKNOWN)).maybe_raise()
+    @staticmethod
+    def _parse_counts(text: str) -> tuple[Counts, dict[int, Counts]]:
+        """Parse the counts out of an API response.
 
-        return [Question(**question) for question in response["results"]]
+        Args:
+            text: The text of the response.
 
-    async def _counts(self) -> None:
-        """Get the low-level counts data."""
-        if self._overall_counts is not None:
-            return
-        counts = loads(await self._call("api_count_global"))
-        self._overall_counts = Counts(
+        Returns:
+            The overall counts, and the counts per category.
+        """
+        counts = loads(text)
+        return Counts(
             counts["overall"]["total_num_of_questions"],
             counts["overall"]["total_num_of_pending_questions"],
             counts["overall"]["total_num_of_verified_questions"],
             counts["overall"]["total_num_of_rejected_questions"],
-        )
-        self._category_counts = {
+        ), {
             int(category): Counts(
                 category_counts["total_num_of_questions"],
                 category_counts["total_num_of_pending_questions"],
@@ -167,6 +858,28 @@ class OpenTriviaDB:
             for category, category_counts in counts["categories"].items()
         }
 
+    async def _counts(self) -> None:
+        """Get the low-level counts data."""
+        if self._overall_counts is not None:
+            self._stats["api_count_global"].cache_hits += 1
+            return
+        self._overall_counts, self._category_counts = self._parse_counts(
+            await self._cached_call("api_count_global")
+        )
+
+    def cached_overall_counts(self) -> Counts | None:
+        """Get the overall question counts without calling the API.
+
+        Returns:
+            The most recent overall counts that are to hand, no matter how
+            old they are, or `None` if there aren't any.
+        """
+        if self._overall_counts is not None:
+            return self._overall_counts
+        if (text := self._cached("api_count_global")) is None:
+            return None
+        return self._parse_counts(text)[0]
+
     async def overall_counts(self) -> Counts:
         """Gets the overall question counts.
 
@@ -176,7 +889,7 @@ class OpenTriviaDB:
         Note:
             Because this is a low-importance value that won't change very
             often, the value is cached for the lifetime of the client
-            object.
+            object, and in the on-disk cache if the client has one.
         """
         await self._counts()
         assert self._overall_counts is not None
@@ -191,10 +904,46 @@ class OpenTriviaDB:
         Note:
             Because this is a low-importance value that won't change very
             often, the value is cached for the lifetime of the client
-            object.
+            object, and in the on-disk cache if the client has one.
         """
         await self._counts()
         return self._category_counts
 
+    async def difficulty_counts(self, category: int | Category) -> DifficultyCounts:
+        """Gets the question counts per difficulty for a category.
+
+        Args:
+            category: The category to get the counts for.
+
+        Returns:
+            The question counts per difficulty.
+
+        Raises:
+            UnknownCategory: If the API has no counts for the category.
+
+        Note:
+            Because this is a low-importance value that won't change very
+            often, the value is cached for the lifetime of the client
+            object, and in the on-disk cache if the client has one.
+        """
+        if isinstance(category, Category):
+            category = category.id
+        if category in self._difficulty_counts:
+            self._stats["api_count"].cache_hits += 1
+        else:
+            try:
+                counts = loads(
+                    await self._cached_call("api_count", category=str(category))
+                )["category_question_count"]
+            except KeyError:
+                raise self.UnknownCategory(f"No category with ID {category}") from None
+            self._difficulty_counts[category] = DifficultyCounts(
+                counts["total_question_count"],
+                counts["total_easy_question_count"],
+                counts["total_medium_question_count"],
+                counts["total_hard_question_count"],
+            )
+        return self._difficulty_counts[category]
+
 
 ### client.py ends here
@@ -4,9 +4,13 @@
 # Python imports.
 from dataclasses import dataclass
 
+##############################################################################
+# Local imports.
+from .question import Difficulty
+
 
 ##############################################################################
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Counts:
     """Class that holds the counts of questions."""
 
@@ -23,4 +27,38 @@ class Counts:
     """The number of rejected questions."""
 
 
+##############################################################################
+@dataclass(frozen=True, slots=True)
+class DifficultyCounts:
+    """Class that holds the counts of questions per difficulty level."""
+
+    questions: int
+    """The total number of questions."""
+
+    easy: int
+    """The number of easy questions."""
+
+    medium: int
+    """The number of medium questions."""
+
+    hard: int
+    """The number of hard questions."""
+
+    def of_difficulty(self, difficulty: Difficulty | None) -> int:
+        """Get the number of questions of a given difficulty.
+
+        Args:
+            difficulty: The difficulty, or `None` for any difficulty.
+
+        Returns:
+            The number of questions of that difficulty.
+        """
+        return {
+            None: self.questions,
+            "easy": self.easy,
+            "medium": self.medium,
+            "hard": self.hard,
+        }[difficulty]
+
+
 ### counts.py ends here
@@ -0,0 +1,45 @@
+"""Provides code for decoding the text encodings the API can use."""
+
+##############################################################################
+# Python imports.
+from base64 import b64decode
+from html import unescape
+from urllib.parse import unquote
+
+##############################################################################
+# Backward-compatible typing.
+from typing_extensions import Literal
+
+##############################################################################
+ApiEncoding = Literal["html", "url3986", "base64"]
+"""The encodings that the API can be asked to use for its text.
+
+`html` is the API's default encoding.
+"""
+
+##############################################################################
+Encoding = ApiEncoding | Literal["plain"]
+"""The encodings that text can be in; `plain` is for text that isn't encoded."""
+
+
+##############################################################################
+def decode(text: str, encoding: Encoding) -> str:
+    """Decode some text from the API.
+
+    Args:
+        text: The text to decode.
+        encoding: The encoding the text is in.
+
+    Returns:
+        The decoded text.
+    """
+    if encoding == "html":
+        return unescape(text)
+    if encoding == "url3986":
+        return unquote(text)
+    if encoding == "base64":
+        return b64decode(text).decode("utf-8")
+    return text
+
+
+### encoding.py ends here
@@ -0,0 +1,227 @@
+"""Provides a local pool of questions, kept in a SQLite database."""
+
+##############################################################################
+# Python imports.
+from contextlib import closing
+from json import dumps, loads
+from pathlib import Path
+from sqlite3 import Connection, connect
+from typing import Iterable
+
+##############################################################################
+# Local imports.
+from .question import Difficulty, Question, Type
+
+
+##############################################################################
+class QuestionPool:
+    """A local pool of every question that has been fetched from the API.
+
+    Each question records how many times it has been served up as part of
+    a quiz, so that questions that have yet to be asked can be preferred.
+    Questions are kept in the encoding they arrived in, so that they don't
+    need to be decoded until they're actually asked.
+
+    Note:
+        A connection to the database is made for each operation, so a pool
+        can safely be used from a thread other than the one that made it.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS questions (
+        question TEXT NOT NULL,
+        correct_answer TEXT NOT NULL,
+        incorrect_answers TEXT NOT NULL,
+        category TEXT NOT NULL,
+        encoding TEXT NOT NULL,
+        category_name TEXT NOT NULL,
+        type TEXT NOT NULL,
+        difficulty TEXT NOT NULL,
+        served INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (question, correct_answer)
+    );
+    CREATE INDEX IF NOT EXISTS questions_by_kind
+        ON questions (category_name, difficulty, type, served);
+    """
+
+    def __init__(self, database: Path) -> None:
+        """Initialise the question pool.
+
+        Args:
+            database: The path to the database that holds the pool.
+        """
+        self._database = database
+        """The path to the database that holds the pool."""
+        self._ready = False
+        """Has the database been set up yet?"""
+
+    def _connect(self) -> Connection:
+        """Connect to the database, creating it if need be.
+
+        Returns:
+            A connection to the database.
+        """
+        connection = connect(self._database)
+        if not self._ready:
+            connection.executescript(self._SCHEMA)
+            self._ready = True
+        return connection
+
+    @staticmethod
+    def _where(
+        category: str | None, difficulty: Difficulty | None, of_type: Type | None
+    ) -> tuple[str, list[str]]:
+        """Build the criteria for finding questions of a particular kind.
+
+        Args:
+            category: The name of the category, if it matters.
+            difficulty: The difficulty, if it matters.
+            of_type: The type of question, if it matters.
+
+        Returns:
+            The text of the criteria, and the values to go with it.
+        """
+        criteria = ["1"]
+        values: list[str] = []
+        for column, value in (
+            ("category_name", category),
+            ("difficulty", difficulty),
+            ("type", of_type),
+        ):
+            if value is not None:
+                criteria.append(f"{column} = ?")
+                values.append(value)
+        return " AND ".join(criteria), values
+
+    @staticmethod
+    def _count(connection: Connection) -> int:
+        """Count the questions in the pool.
+
+        Args:
+            connection: The connection to the database.
+
+        Returns:
+            The total number of questions in the pool.
+        """
+        return int(connection.execute("SELECT count(*) FROM questions").fetchone()[0])
+
+    def add(self, questions: Iterable[Question], served: bool = False) -> int:
+        """Add some questions to the pool.
+
+        Args:
+            questions: The questions to add.
+            served: Have the questions already been served up?
+
+        Returns:
+            The number of questions that were new to the pool.
+        """
+        with closing(self._connect()) as connection, connection:
+            before = self._count(connection)
+            connection.executemany(
+                "INSERT INTO questions "
+                "(question, correct_answer, incorrect_answers, category, encoding, "
+                "category_name, type, difficulty, served) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (question, correct_answer) "
+                "DO UPDATE SET served = served + excluded.served",
+                (
+                    (
+                        question.raw_question,
+                        question.raw_correct_answer,
+                        dumps(question.raw_incorrect_answers),
+                        question.raw_category,
+                        question.encoding,
+                        question.category,
+                        question.type,
+                        question.difficulty,
+                        int(served),
+                    )
+                    for question in questions
+                ),
+            )
+            return self._count(connection) - before
+
+    def take(
+        self,
+        amount: int,
+        category: str | None = None,
+        difficulty: Difficulty | None = None,
+        of_type: Type | None = None,
+        include_served: bool = False,
+    ) -> list[Question]:
+        """Take some questions from the pool, marking them as served.
+
+        Args:
+            amount: The maximum number of questions to take.
+            category: The name of the category of questions to take.
+            difficulty: The difficulty of questions to take.
+            of_type: The type of question to take.
+            include_served: Can questions that have been served before be
+                taken?
+
+        Returns:
+            The questions taken from the pool, in a random order.
+
+        Note:
+            When served questions can be taken, those that have been served
+            the least are preferred.
+        """
+        where, values = self._where(category, difficulty, of_type)
+        if not include_served:
+            where += " AND served = 0"
+        with closing(self._connect()) as connection, connection:
+            rows = connection.execute(
+                "SELECT rowid, type, difficulty, category, question, correct_answer, "
+                "incorrect_answers, encoding "
+                f"FROM questions WHERE {where} ORDER BY served, random() LIMIT ?",
+                (*values, amount),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE questions SET served = served + 1 WHERE rowid = ?",
+                ((row[0],) for row in rows),
+            )
+        return [
+            Question(
+                question_type,
+                difficulty,
+                category,
+                question,
+                correct_answer,
+                loads(incorrect_answers),
+                encoding,
+            )
+            for _, question_type, difficulty, category, question, correct_answer, incorrect_answers, encoding in rows
+        ]
+
+    def available(
+        self,
+        category: str | None = None,
+        difficulty: Difficulty | None = None,
+        of_type: Type | None = None,
+    ) -> int:
+        """Get the number of questions in the pool yet to be served.
+
+        Args:
+            category: The name of the category of questions to count.
+            difficulty: The difficulty of questions to count.
+            of_type: The type of question to count.
+
+        Returns:
+            The number of matching questions that have yet to be served.
+        """
+        where, values = self._where(category, difficulty, of_type)
+        with closing(self._connect()) as connection:
+            return int(
+                connection.execute(
+                    f"SELECT count(*) FROM questions WHERE {where} AND served = 0",
+                    values,
+                ).fetchone()[0]
+            )
+
+    def __len__(self) -> int:
+        """The total number of questions in the pool."""
+        with closing(self._connect()) as connection:
+            return self._count(connection)
+
+
+### pool.py ends here
@@ -1,12 +1,22 @@
 """Provides a class that holds questions pulled from the API."""
 
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
-from dataclasses import dataclass, field
-from html import unescape
+from dataclasses import FrozenInstanceError
+from functools import partial
+from sys import intern
+from typing import Any, Iterable, cast
 
 from typing_extensions import Literal
 
+##############################################################################
+# Local imports.
+from .encoding import Encoding, decode
+
 ##############################################################################
 Type = Literal["multiple", "boolean"]
 """The valid types of question."""
@@ -17,9 +27,29 @@ Difficulty = Literal["easy", "medium", "hard"]
 
 
 ##############################################################################
-@dataclass
 class Question:
-    """Holds the details of a question."""
+    """Holds the details of a question.
+
+    The text of the question is held as it was encoded by the API, and each
+    part of it is only decoded the first time it is asked for. Questions
+    can't be modified once they've been created.
+    """
+
+    __slots__ = (
+        "type",
+        "difficulty",
+        "encoding",
+        "raw_category",
+        "raw_question",
+        "raw_correct_answer",
+        "raw_incorrect_answers",
+        "_category",
+        "_question",
+        "_correct_answer",
+        "_incorrect_answers",
+        "_answers",
+        "_correct_index",
+    )
 
     type: Type
     """The type of the question."""
@@ -27,29 +57,216 @@ class Question:
     difficulty: Difficulty
     """The difficulty level of the question."""
 
-    category: str
-    """The name of the category that the question is within."""
+    encoding: Encoding
+    """The encoding used for the text of the question."""
+
+    raw_category: str
+    """The encoded name of the category of the question."""
+
+    raw_question: str
+    """The encoded question."""
+
+    raw_correct_answer: str
+    """The encoded correct answer."""
+
+    raw_incorrect_answers: tuple[str, ...]
+    """The encoded incorrect answers."""
+
+    _category: str
+    """The decoded category, once it has been asked for."""
+
+    _question: str
+    """The decoded question, once it has been asked for."""
+
+    _correct_answer: str
+    """The decoded correct answer, once it has been asked for."""
+
+    _incorrect_answers: tuple[str, ...]
+    """The decoded incorrect answers, once they have been asked for."""
+
+    _answers: tuple[str, ...]
+    """All of the answers in the order they're shown, once worked out."""
+
+    _correct_index: int
+    """The index of the correct answer within the answers, once worked out."""
+
+    def __init__(  # pylint:disable=redefined-builtin,too-many-arguments
+        self,
+        type: Type,
+        difficulty: Difficulty,
+        category: str,
+        question: str,
+        correct_answer: str,
+        incorrect_answers: Iterable[str] = (),
+        encoding: Encoding = "html",
+    ) -> None:
+        """Initialise the question.
+
+        Args:
+            type: The type of the question.
+            difficulty: The difficulty level of the question.
+            category: The encoded name of the category of the question.
+            question: The encoded question itself.
+            correct_answer: The encoded correct answer to the question.
+            incorrect_answers: The encoded incorrect answers to the question.
+            encoding: The encoding used for the text of the question.
+
+        Note:
+            The type, difficulty, encoding and category are interned, as
+            they're shared by a great many questions.
+        """
+        initialise = partial(object.__setattr__, self)
+        initialise("type", intern(type))
+        initialise("difficulty", intern(difficulty))
+        initialise("encoding", intern(encoding))
+        initialise("raw_category", intern(category))
+        initialise("raw_question", question)
+        initialise("raw_correct_answer", correct_answer)
+        initialise("raw_incorrect_answers", tuple(incorrect_answers))
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any], encoding: Encoding = "html") -> Question:
+        """Create a question from the data the API returned for it.
+
+        Args:
+            data: The data for the question.
+            encoding: The encoding the API used for the data.
+
+        Returns:
+            The question.
+        """
+        return cls(
+            cast(Type, decode(data["type"], encoding)),
+            cast(Difficulty, decode(data["difficulty"], encoding)),
+            data["category"],
+            data["question"],
+            data["correct_answer"],
+            data["incorrect_answers"],
+            encoding,
+        )
 
-    question: str
-    """The question itself."""
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
 
-    correct_answer: str
-    """The correct answer to the question."""
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
 
-    incorrect_answers: list[str] = field(default_factory=list)
-    """The incorrect answers for the question."""
+    def _decoded(self, cache: str, raw: str) -> str:
+        """Get some decoded text, decoding it if it hasn't been already.
 
-    def __post_init__(self) -> None:
-        """Tidy up the question data once it's been loaded up."""
-        self.category = unescape(self.category)
-        self.question = unescape(self.question)
-        self.correct_answer = unescape(self.correct_answer)
-        self.incorrect_answers = [unescape(answer) for answer in self.incorrect_answers]
+        Args:
+            cache: The name of the slot the decoded text is kept in.
+            raw: The encoded text.
+
+        Returns:
+            The decoded text.
+        """
+        try:
+            return cast(str, getattr(self, cache))
+        except AttributeError:
+            decoded = decode(raw, self.encoding)
+            object.__setattr__(self, cache, decoded)
+            return decoded
+
+    @property
+    def category(self) -> str:
+        """The name of the category that the question is within."""
+        try:
+            return self._category
+        except AttributeError:
+            category = intern(decode(self.raw_category, self.encoding))
+            object.__setattr__(self, "_category", category)
+            return category
+
+    @property
+    def question(self) -> str:
+        """The question itself."""
+        return self._decoded("_question", self.raw_question)
+
+    @property
+    def correct_answer(self) -> str:
+        """The correct answer to the question."""
+        return self._decoded("_correct_answer", self.raw_correct_answer)
+
+    @property
+    def incorrect_answers(self) -> tuple[str, ...]:
+        """The incorrect answers for the question."""
+        try:
+            return self._incorrect_answers
+        except AttributeError:
+            answers = tuple(
+                decode(answer, self.encoding) for answer in self.raw_incorrect_answers
+            )
+            object.__setattr__(self, "_incorrect_answers", answers)
+            return answers
+
+    @property
+    def as_json(self) -> dict[str, Any]:
+        """The decoded question as a JSON-friendly dictionary."""
+        return {
+            "type": self.type,
+            "difficulty": self.difficulty,
+            "category": self.category,
+            "question": self.question,
+            "correct_answer": self.correct_answer,
+            "incorrect_answers": list(self.incorrect_answers),
+        }
 
     @property
-    def answers(self) -> list[str]:
+    def key(self) -> tuple[str, str]:
+        """A key that identifies the question, without needing to decode it."""
+        return self.raw_question, self.raw_correct_answer
+
+    def _order_answers(self) -> None:
+        """Work out the order of the answers, and where the correct one is."""
+        answers = (self.correct_answer, *self.incorrect_answers)
+        order = sorted(range(len(answers)), key=lambda index: answers[index].casefold())
+        object.__setattr__(self, "_answers", tuple(answers[index] for index in order))
+        object.__setattr__(self, "_correct_index", order.index(0))
+
+    @property
+    def answers(self) -> tuple[str, ...]:
         """All of the answers to the question, sorted in alphabetical order."""
-        return sorted([self.correct_answer, *self.incorrect_answers], key=str.casefold)
+        try:
+            return self._answers
+        except AttributeError:
+            self._order_answers()
+            return self._answers
+
+    @property
+    def correct_index(self) -> int:
+        """The index of the correct answer within the answers."""
+        try:
+            return self._correct_index
+        except AttributeError:
+            self._order_answers()
+            return self._correct_index
+
+    def is_correct(self, index: int) -> bool:
+        """Is the answer at the given index the correct answer?
+
+        Args:
+            index: The index of the answer within the answers.
+
+        Returns:
+            `True` if it's the correct answer, `False` if not.
+        """
+        return index == self.correct_index
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Question):
+            return (self.key, self.encoding) == (other.key, other.encoding)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.key, self.encoding))
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(type={self.type!r}, "
+            f"difficulty={self.difficulty!r}, question={self.raw_question!r}, "
+            f"encoding={self.encoding!r})"
+        )
 
 
 ### question.py ends here
@@ -0,0 +1,92 @@
+"""Provides a scheduler for keeping within the API's rate limit."""
+
+##############################################################################
+# Python imports.
+from asyncio import Lock, sleep
+from time import monotonic
+from typing import Callable
+
+
+##############################################################################
+class RateLimiter:
+    """Spaces out calls so that they stay within a rate limit.
+
+    Callers queue up in the order in which they ask for a slot, and each is
+    let go no sooner than `interval` seconds after the previous one.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        on_wait: Callable[[float], None] | None = None,
+    ) -> None:
+        """Initialise the rate limiter.
+
+        Args:
+            interval: The minimum number of seconds between calls.
+            on_wait: Optional callback that is told how long a caller is
+                going to have to wait for its slot.
+        """
+        self._interval = interval
+        """The minimum number of seconds between calls."""
+        self._on_wait = on_wait
+        """The callback to tell about any wait."""
+        self._lock = Lock()
+        """The lock that keeps callers queued in order."""
+        self._next_slot = 0.0
+        """The monotonic time at which the next call can be made."""
+        self._queued = 0
+        """The number of callers waiting for a slot."""
+
+    @property
+    def interval(self) -> float:
+        """The minimum number of seconds between calls."""
+        return self._interval
+
+    @property
+    def wait_time(self) -> float:
+        """The number of seconds until the next slot becomes free."""
+        return max(0.0, self._next_slot - monotonic())
+
+    @property
+    def queued(self) -> int:
+        """The number of callers that are waiting for a slot."""
+        return self._queued
+
+    @property
+    def busy(self) -> bool:
+        """Is anyone using or waiting on the rate limiter?"""
+        return bool(self._queued)
+
+    @property
+    def idle(self) -> bool:
+        """Has nobody used or waited on the rate limiter for a full interval?"""
+        return not self.busy and not self.wait_time
+
+    async def slot(self) -> None:
+        """Wait for the next available slot.
+
+        When this returns the caller is free to make its call; the slot
+        after this one will be at least `interval` seconds away.
+        """
+        self._queued += 1
+        try:
+            async with self._lock:
+                if (wait := self.wait_time) > 0:
+                    if self._on_wait is not None:
+                        self._on_wait(wait)
+                    await sleep(wait)
+                self._next_slot = monotonic() + self._interval
+        finally:
+            self._queued -= 1
+
+    def back_off(self) -> None:
+        """Push the next slot back a full interval from now.
+
+        Call this when the backend has complained about being called too
+        often, so that the next caller gives it a proper rest.
+        """
+        self._next_slot = monotonic() + self._interval
+
+
+### rate_limit.py ends here
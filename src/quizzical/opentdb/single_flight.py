@@ -0,0 +1,53 @@
+"""Provides a way of sharing one in-flight call between many callers."""
+
+##############################################################################
+# Python imports.
+from asyncio import Task, create_task, shield
+from typing import Any, Awaitable, Callable, Hashable, TypeVar, cast
+
+##############################################################################
+Result = TypeVar("Result")
+"""The type of the result of a call."""
+
+
+##############################################################################
+class SingleFlight:
+    """Makes concurrent identical calls share a single call.
+
+    While a call for a given key is in flight, anyone else making a call
+    with the same key waits on that call rather than making their own,
+    and gets the same result or exception.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the single-flight object."""
+        self._in_flight: dict[Hashable, Task[Any]] = {}
+        """The calls currently in flight, keyed by what they're for."""
+
+    async def call(
+        self, key: Hashable, make_call: Callable[[], Awaitable[Result]]
+    ) -> Result:
+        """Make a call, or join an identical call that is already in flight.
+
+        Args:
+            key: The key that identifies the call.
+            make_call: A function that makes the call.
+
+        Returns:
+            The result of the call.
+
+        Note:
+            If a caller is cancelled, the call itself carries on for the
+            benefit of anyone else waiting on it.
+        """
+        if (task := self._in_flight.get(key)) is None:
+
+            async def run() -> Result:
+                return await make_call()
+
+            task = self._in_flight[key] = create_task(run())
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return cast(Result, await shield(task))
+
+
+### single_flight.py ends here
@@ -0,0 +1,114 @@
+"""Provides classes for keeping statistics about calls to the API."""
+
+##############################################################################
+# Python imports.
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Final
+
+##############################################################################
+LATENCY_BOUNDS: Final[tuple[float, ...]] = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+"""The upper bounds, in seconds, of the latency histogram buckets."""
+
+
+##############################################################################
+@dataclass
+class LatencyHistogram:
+    """A histogram of call latencies."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BOUNDS) + 1))
+    """The count of calls in each bucket; the last is for anything slower."""
+
+    total: float = 0.0
+    """The total number of seconds spent on all calls."""
+
+    def record(self, seconds: float) -> None:
+        """Record the latency of a call.
+
+        Args:
+            seconds: The number of seconds the call took.
+        """
+        self.buckets[bisect_left(LATENCY_BOUNDS, seconds)] += 1
+        self.total += seconds
+
+    @property
+    def count(self) -> int:
+        """The number of calls recorded."""
+        return sum(self.buckets)
+
+    @property
+    def mean(self) -> float:
+        """The mean latency of the calls recorded."""
+        return self.total / self.count if self.count else 0.0
+
+
+##############################################################################
+@dataclass
+class ModuleStats:
+    """Statistics about calls to an API module."""
+
+    requests: int = 0
+    """The number of requests made."""
+
+    errors: int = 0
+    """The number of requests that failed."""
+
+    retries: int = 0
+    """The number of requests that were retries."""
+
+    bytes_received: int = 0
+    """The number of bytes received in responses."""
+
+    cache_hits: int = 0
+    """The number of times a cached response was used."""
+
+    cache_misses: int = 0
+    """The number of times there was no cached response to use."""
+
+    rate_limit_waits: int = 0
+    """The number of times a request was held back by the rate limit."""
+
+    rate_limit_wait_time: float = 0.0
+    """The total number of seconds requests were held back by the rate limit."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    """The histogram of request latencies."""
+
+
+##############################################################################
+class Stats(dict[str, ModuleStats]):
+    """Statistics about calls to the API, keyed by module."""
+
+    def __missing__(self, module: str) -> ModuleStats:
+        self[module] = ModuleStats()
+        return self[module]
+
+    @property
+    def report(self) -> str:
+        """The statistics as a plain text report."""
+        lines: list[str] = []
+        for module, stats in sorted(self.items()):
+            lines += [
+                f"{module}:",
+                f"  requests:        {stats.requests}",
+                f"  errors:          {stats.errors}",
+                f"  retries:         {stats.retries}",
+                f"  bytes received:  {stats.bytes_received}",
+                f"  cache hits:      {stats.cache_hits}",
+                f"  cache misses:    {stats.cache_misses}",
+                f"  rate limit wait: {stats.rate_limit_waits} "
+                f"({stats.rate_limit_wait_time:.2f}s)",
+                f"  mean latency:    {stats.latency.mean:.3f}s",
+                "  latency histogram:",
+            ]
+            lines += [
+                f"    <= {bound:>5}s: {count}"
+                for bound, count in zip(LATENCY_BOUNDS, stats.latency.buckets)
+            ]
+            lines.append(
+                f"     > {LATENCY_BOUNDS[-1]:>5}s: {stats.latency.buckets[-1]}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+### stats.py ends here